@@ -1,24 +1,33 @@
 """Crow/AAP IP Module init file."""
 import asyncio
 import logging
+import time
 import voluptuous as vol
 
-from pycrowipmodule import CrowIPAlarmPanel
 from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import (
     CONF_HOST, CONF_PORT, CONF_TIMEOUT, EVENT_HOMEASSISTANT_STOP, Platform
 )
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.importlib import async_import_module
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN, DATA_CRW, CONF_KEEP_ALIVE,
-    CONF_AREAS, CONF_ZONES, CONF_OUTPUTS,
-    DEFAULT_PORT, DEFAULT_KEEPALIVE, DEFAULT_TIMEOUT,
+    CONF_AREAS, CONF_ZONES, CONF_OUTPUTS, CONF_MQTT_EXPORT, CONF_MQTT_PREFIX,
+    DEFAULT_PORT, DEFAULT_KEEPALIVE, DEFAULT_TIMEOUT, DEFAULT_MQTT_PREFIX,
     SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, 
     SIGNAL_SYSTEM_UPDATE, SIGNAL_OUTPUT_UPDATE
 )
+from .connection import CrowConnection
+from .entity import CrowData, build_device_info
+from .priority import CrowEventQueue
+from .summary import CrowSiteSummary
+from .supervision import CrowZoneSupervision
+from .timeline import CrowTimeline
+from .tracker import CrowObjectTracker
+from .services import async_setup_services
+from .websocket import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +39,8 @@ CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({}, extra=vol.ALLOW_EXTRA)}, extr
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Crow IP Module component from YAML (Import)."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
+    async_setup_websocket(hass)
     if DOMAIN in config:
         hass.async_create_task(
             hass.config_entries.flow.async_init(
@@ -40,27 +51,61 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Crow IP Module from a config entry."""
-    
+    setup_started = time.monotonic()
+
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     keep_alive = entry.data.get(CONF_KEEP_ALIVE, 60)
     connection_timeout = entry.data.get(CONF_TIMEOUT, 10)
     
     # 1. Controller Init
+    # Die Lib wird erst hier (im Executor) importiert, damit das Laden der
+    # Integration den Bootstrap nicht aufhält.
+    import_started = time.monotonic()
+    pycrowipmodule = await async_import_module(hass, "pycrowipmodule")
+    import_time = time.monotonic() - import_started
+
     # Wir übergeben keinen Loop, da pycrowipmodule (hoffentlich) den laufenden Loop nutzt oder Threads verwendet.
-    controller = CrowIPAlarmPanel(
+    controller = pycrowipmodule.CrowIPAlarmPanel(
         host, port, "0000", keep_alive, None, connection_timeout
     )
 
-    hass.data[DOMAIN][entry.entry_id] = controller
+    # Gemeldete Zonen/Ausgänge (bestimmt, welche Entities angelegt werden)
+    tracker = CrowObjectTracker(hass, entry.entry_id, controller, entry.options)
+    await tracker.async_load()
+    entry.async_on_unload(tracker.async_stop)
+
+    timeline = CrowTimeline(controller)
+    connection = CrowConnection(hass, controller, entry.entry_id)
+    entry.async_on_unload(connection.async_add_listener(tracker.async_set_connected))
+    summary = CrowSiteSummary(hass, entry, controller)
+    summary.async_start()
+    entry.async_on_unload(summary.async_stop)
+    # Zonen mit Überwachungsfenster (Funkmelder mit leerer Batterie etc.)
+    supervision = CrowZoneSupervision(hass, entry, tracker)
+    supervision.async_start()
+    entry.async_on_unload(supervision.async_stop)
+
+    # Alarm/Sabotage/Netzausfall überholen Routine-Updates (CrowEventQueue)
+    event_queue = CrowEventQueue(hass, entry.entry_id, controller, entry.options)
+    entry.async_on_unload(event_queue.close)
+
+    hass.data[DOMAIN][entry.entry_id] = CrowData(
+        entry.entry_id, controller, connection, build_device_info(host),
+        tracker, timeline, summary, supervision, event_queue,
+    )
 
     # 2. Thread-Safe Callbacks
     # WICHTIG: Da die Crow-Lib in einem eigenen Thread läuft, müssen wir
     # updates Thread-Safe an den HA-Main-Loop übergeben.
-    
+
     def _thread_safe_send(signal, data):
         """Helper to send dispatcher signals thread-safely."""
-        hass.loop.call_soon_threadsafe(async_dispatcher_send, hass, signal, data)
+        if data == "":
+            # Lib liefert '' wenn kein Handler das Objekt bestimmen konnte
+            data = None
+        timeline.record(signal, data)
+        event_queue.submit(signal, data)
 
     def zones_updated_callback(data):
         _thread_safe_send(SIGNAL_ZONE_UPDATE, data)
@@ -76,9 +121,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     def connected_callback(data):
         _LOGGER.info("Established a connection with the Crow Ip Module")
+        connection.connected()
 
     def connection_fail_callback(data):
         _LOGGER.error("Could not establish a connection with the Crow Ip Module")
+        connection.connect_failed()
 
     # Callbacks registrieren
     controller.callback_zone_state_change = zones_updated_callback
@@ -94,24 +141,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Wir rufen .start() im Executor auf, warten aber NICHT darauf (kein await).
     # Damit kann async_setup_entry sofort 'True' zurückgeben und HA bootet weiter,
     # während der Controller im Hintergrund versucht sich zu verbinden.
-    hass.async_add_executor_job(controller.start)
+    # Bei vielen Zentralen reiht CrowFleetScheduler die Starts gestaffelt ein.
+    connection.start()
 
-    # 4. Plattformen laden
+    # 4. Plattformen laden (HA richtet sie parallel ein)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug(
+        "Setup of %s took %.3fs (library import %.3fs, %d zones)",
+        host, time.monotonic() - setup_started, import_time,
+        len(entry.options.get(CONF_ZONES, {})),
+    )
     
-    # 5. Shutdown Listener
+    # 5. Optionaler MQTT-Export (nur importiert, wenn aktiviert)
+    # Startet im Hintergrund: auf den MQTT-Client zu warten, hält das Setup nicht auf.
+    if entry.options.get(CONF_MQTT_EXPORT):
+        from .export import CrowMqttExporter
+
+        prefix = entry.options.get(CONF_MQTT_PREFIX) or f"{DEFAULT_MQTT_PREFIX}/{host}"
+        exporter = CrowMqttExporter(hass, entry.entry_id, controller, prefix)
+        entry.async_on_unload(exporter.async_stop)
+        entry.async_create_background_task(
+            hass, exporter.async_start(), f"{DOMAIN} MQTT export {host}"
+        )
+
+    # 6. Shutdown Listener (mit festem Zeitlimit, blockiert den Loop nicht)
+    async def _async_stop(event):
+        await connection.async_stop()
+
     entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, lambda event: controller.stop())
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
     )
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # Sonst legt eine während des Entladens neu gemeldete Zone ihre Entity
+    # auf der schon entladenen Plattform an, wo sie verwaist liegen bleibt
+    hass.data[DOMAIN][entry.entry_id].event_queue.close()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        controller = hass.data[DOMAIN][entry.entry_id]
-        # Stop auch im Executor ausführen, um Blocking zu vermeiden
-        await hass.async_add_executor_job(controller.stop)
+        # Befehle rausschreiben, Verbindung schließen, Tasks abbrechen (max. STOP_TIMEOUT)
+        await hass.data[DOMAIN][entry.entry_id].connection.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data of a deleted config entry."""
+    await CrowObjectTracker(hass, entry.entry_id, None, {}).async_remove()
@@ -9,10 +9,7 @@ from homeassistant.components.alarm_control_panel import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.const import CONF_HOST
 
 from .const import (
     DOMAIN,
@@ -20,6 +17,7 @@ from .const import (
     SIGNAL_KEYPAD_UPDATE,
     CONF_AREAS,
 )
+from .entity import CrowEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,9 +27,8 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    controller = hass.data[DOMAIN][entry.entry_id]
+    data = hass.data[DOMAIN][entry.entry_id]
     options = entry.options
-    host = entry.data[CONF_HOST]
     
     configured_areas = options.get(CONF_AREAS, {})
     
@@ -46,8 +43,8 @@ async def async_setup_entry(
         area_num = int(area_num_str)
         if area_num in [1, 2]:
             devices.append(CrowAlarmPanel(
-                controller, host,
-                area_num, 
+                data,
+                area_num,
                 area_data.get("name", f"Area {area_num}"),
                 area_data.get("code", ""),
                 area_data.get("code_arm_required", True)
@@ -56,13 +53,11 @@ async def async_setup_entry(
     async_add_entities(devices)
 
 
-class CrowAlarmPanel(AlarmControlPanelEntity):
-    _attr_has_entity_name = True
+class CrowAlarmPanel(CrowEntity, AlarmControlPanelEntity):
     _attr_name = None
 
-    def __init__(self, controller, host, area_number, name, code, code_required) -> None:
-        self._controller = controller
-        self._host = host
+    def __init__(self, data, area_number, name, code, code_required) -> None:
+        super().__init__(data)
         self._area_number_int = area_number
         self._area_number = "A" if area_number == 1 else "B"
         
@@ -73,32 +68,19 @@ class CrowAlarmPanel(AlarmControlPanelEntity):
         self._code = code
         # Info: code_required kommt aus der Config, wir nutzen es unten in der Property
         self._code_arm_required_config = code_required
-        
-        self._info = controller.area_state.get(area_number, {"status": {}})
 
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, "crow_alarm_panel")},
-            name="Crow Alarm System",
-            manufacturer="Crow/AAP",
-            model="IP Module",
-            configuration_url=f"http://{self._host}",
-        )
+    def _info(self):
+        # Immer frisch aus der Lib lesen, keine Referenz auf deren Dicts halten
+        return self._controller.area_state.get(self._area_number_int, {"status": {}})
 
     async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_AREA_UPDATE, self._update_callback)
-        )
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_KEYPAD_UPDATE, self._update_callback)
-        )
+        self._async_subscribe(SIGNAL_AREA_UPDATE, self._update_callback)
+        self._async_subscribe(SIGNAL_KEYPAD_UPDATE, self._update_callback)
 
     @callback
     def _update_callback(self, area) -> None:
         if area is None or area == self._area_number:
-            if self._area_number_int in self._controller.area_state:
-                self._info = self._controller.area_state[self._area_number_int]
             self.async_write_ha_state()
 
     @property
@@ -5,35 +5,53 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.core import callback
-from homeassistant.const import CONF_HOST
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    DOMAIN, SIGNAL_ZONE_UPDATE, SIGNAL_SYSTEM_UPDATE,
+    DOMAIN, SIGNAL_ZONE_UPDATE, SIGNAL_SYSTEM_UPDATE, SIGNAL_SUPERVISION_UPDATE,
     CONF_ZONES, CONF_OBJ_MAINS, CONF_OBJ_BATTERY, 
     CONF_OBJ_TAMPER, CONF_OBJ_LINE, CONF_OBJ_DIALLER, CONF_OBJ_ZONE_BATTERY
 )
+from .entity import CrowEntity
+from .tracker import KIND_ZONE, new_object_signal
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Crow binary sensors."""
-    controller = hass.data[DOMAIN][entry.entry_id]
-    options = entry.options
-    host = entry.data[CONF_HOST]
-    
-    entities = []
+    data = hass.data[DOMAIN][entry.entry_id]
+    configured_zones = entry.options.get(CONF_ZONES, {})
+
+    def _zone_sensor(zone_num):
+        zone_info = configured_zones.get(str(zone_num), {})
+        return CrowZoneSensor(
+            data, zone_num,
+            zone_info.get("name", f"Zone {zone_num}"), zone_info.get("type", "motion")
+        )
 
     # 1. ZONEN (Fenster, Türen, Bewegung)
-    configured_zones = options.get(CONF_ZONES, {})
-    for zone_num_str, zone_info in configured_zones.items():
-        zone_num = int(zone_num_str)
-        entities.append(CrowZoneSensor(
-            controller, host, zone_num, zone_info["name"], zone_info["type"]
+    # Konfigurierte Zonen und solche, deren Zustand sich schon geändert hat.
+    # Neue kommen per Signal dazu.
+    entities = [_zone_sensor(num) for num in data.tracker.known(KIND_ZONE)]
+
+    @callback
+    def _async_add_zone(zone_num):
+        async_add_entities([_zone_sensor(zone_num)])
+
+    entry.async_on_unload(async_dispatcher_connect(
+        hass, new_object_signal(entry.entry_id, KIND_ZONE), _async_add_zone
+    ))
+
+    # 2. ÜBERWACHUNG (Zonen mit Überwachungsfenster, auch wenn nie gemeldet)
+    for zone_num in sorted(data.supervision.windows):
+        zone_info = configured_zones.get(str(zone_num), {})
+        entities.append(CrowZoneSupervisionSensor(
+            data, zone_num, zone_info.get("name", f"Zone {zone_num}")
         ))
 
-    # 2. SYSTEM STATUS (Diagnose Sensoren)
+    # 3. SYSTEM STATUS (Diagnose Sensoren)
     # Definition: (Key im Dict, Name für UI, Device Class)
     system_sensors = [
         (CONF_OBJ_MAINS, "Mains Power", BinarySensorDeviceClass.POWER),
@@ -45,43 +63,43 @@ async def async_setup_entry(hass, entry, async_add_entities):
     ]
 
     for key, name, dev_class in system_sensors:
-        entities.append(CrowSystemStatusSensor(controller, host, key, name, dev_class))
+        entities.append(CrowSystemStatusSensor(data, key, name, dev_class))
 
     async_add_entities(entities)
 
 
-class CrowBaseEntity(BinarySensorEntity):
+class CrowBaseEntity(CrowEntity, BinarySensorEntity):
     """Basisklasse für alle Crow Binary Sensoren."""
-    _attr_has_entity_name = True
 
-    def __init__(self, controller, host):
-        self._controller = controller
-        self._host = host
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, "crow_alarm_panel")},
-            name="Crow Alarm System",
-            manufacturer="Crow/AAP",
-            model="IP Module",
-            configuration_url=f"http://{self._host}",
-        )
+def _last_seen(tracker, zone_number):
+    timestamp = tracker.last_seen(KIND_ZONE, zone_number)
+    return None if timestamp is None else dt_util.utc_from_timestamp(timestamp).isoformat()
+
 
 class CrowZoneSensor(CrowBaseEntity):
     """Repräsentation einer Alarm-Zone (Fenster/Tür)."""
-    def __init__(self, controller, host, zone_number, zone_name, zone_type):
-        super().__init__(controller, host)
+    def __init__(self, data, zone_number, zone_name, zone_type):
+        super().__init__(data)
         self._zone_number = zone_number
+        self._tracker = data.tracker
+        self._supervision = data.supervision
         self._attr_name = zone_name
         self._attr_device_class = zone_type
         self._attr_unique_id = f"crow_zone_{zone_number}"
-        self._info = controller.zone_state.get(zone_number, {"status": {"open": False}})
+
+    @property
+    def _info(self):
+        # Immer frisch aus der Lib lesen, keine Referenz auf deren Dicts halten
+        return self._controller.zone_state.get(self._zone_number, {"status": {"open": False}})
 
     async def async_added_to_hass(self):
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_ZONE_UPDATE, self._update_callback)
-        )
+        self._async_subscribe(SIGNAL_ZONE_UPDATE, self._update_callback)
+        self._async_subscribe(SIGNAL_SUPERVISION_UPDATE, self._update_callback)
+
+    @property
+    def available(self):
+        # Zone hat ihr Überwachungsfenster verpasst -> letzter Zustand ist nicht mehr gültig
+        return not self._supervision.is_missed(self._zone_number)
 
     @property
     def is_on(self):
@@ -89,20 +107,51 @@ class CrowZoneSensor(CrowBaseEntity):
 
     @property
     def extra_state_attributes(self):
-        return self._info["status"]
+        return {**self._info["status"], "last_seen": _last_seen(self._tracker, self._zone_number)}
 
     @callback
     def _update_callback(self, zone):
         if zone is None or int(zone) == self._zone_number:
-            if self._zone_number in self._controller.zone_state:
-                self._info = self._controller.zone_state[self._zone_number]
+            self.async_write_ha_state()
+
+class CrowZoneSupervisionSensor(CrowBaseEntity):
+    """Problem-Sensor: Zone hat sich innerhalb ihres Überwachungsfensters nicht gemeldet."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, data, zone_number, zone_name):
+        super().__init__(data)
+        self._zone_number = zone_number
+        self._tracker = data.tracker
+        self._supervision = data.supervision
+        self._attr_name = f"{zone_name} Supervision"
+        self._attr_unique_id = f"crow_supervision_{data.entry_id}_{zone_number}"
+
+    async def async_added_to_hass(self):
+        self._async_subscribe(SIGNAL_SUPERVISION_UPDATE, self._update_callback)
+
+    @property
+    def is_on(self):
+        return self._supervision.is_missed(self._zone_number)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "last_seen": _last_seen(self._tracker, self._zone_number),
+            "window": self._supervision.windows[self._zone_number] // 60,
+        }
+
+    @callback
+    def _update_callback(self, zone):
+        if zone == self._zone_number:
             self.async_write_ha_state()
 
 class CrowSystemStatusSensor(CrowBaseEntity):
     """Repräsentation eines System-Status (Diagnose)."""
     
-    def __init__(self, controller, host, key, name, device_class):
-        super().__init__(controller, host)
+    def __init__(self, data, key, name, device_class):
+        super().__init__(data)
         self._key = key
         self._attr_name = name
         self._attr_device_class = device_class
@@ -112,9 +161,7 @@ class CrowSystemStatusSensor(CrowBaseEntity):
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     async def async_added_to_hass(self):
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_SYSTEM_UPDATE, self._update_callback)
-        )
+        self._async_subscribe(SIGNAL_SYSTEM_UPDATE, self._update_callback)
 
     @property
     def is_on(self):
@@ -3,8 +3,11 @@ import logging
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN,
@@ -15,7 +18,19 @@ from .const import (
     CONF_AREAS,
     CONF_ZONES,
     CONF_OUTPUTS,
+    CONF_MQTT_EXPORT,
+    CONF_MQTT_PREFIX,
+    CONF_RELAYS,
+    CONF_RETIRE_AFTER,
+    CONF_PULSE_LENGTH,
+    CONF_SUPERVISION,
+    DEFAULT_RELAYS,
+    DEFAULT_RETIRE_AFTER,
+    DEFAULT_PULSE_LENGTH,
+    DEFAULT_SUPERVISION,
+    DISCOVERY_MANUAL,
 )
+from .discovery import async_discover, async_probe
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +47,7 @@ class CrowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.areas_config = {}
         self.outputs_config = {}
         self.zones_config = {}
+        self.discovered_host = None
 
     async def async_step_user(self, user_input=None):
         return await self.async_step_areas()
@@ -62,7 +78,7 @@ class CrowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_zones(self, user_input=None):
         if user_input is not None:
             self.zones_config = user_input
-            return await self.async_step_connection()
+            return await self.async_step_find()
 
         schema = {}
         for i in range(1, 17):
@@ -71,6 +87,32 @@ class CrowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(step_id="zones", data_schema=vol.Schema(schema))
 
+    async def async_step_find(self, user_input=None):
+        """Let the user choose between a network search and manual entry."""
+        return self.async_show_menu(step_id="find", menu_options=["discovery", "connection"])
+
+    async def async_step_discovery(self, user_input=None):
+        """Search the local /24 for IP modules and offer them as choices."""
+        if user_input is not None:
+            if user_input[CONF_HOST] != DISCOVERY_MANUAL:
+                self.discovered_host = user_input[CONF_HOST]
+            return await self.async_step_connection()
+
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+        except HomeAssistantError:
+            return await self.async_step_connection()
+
+        configured = {entry.data.get(CONF_HOST) for entry in self._async_current_entries()}
+        found = await async_discover(f"{source_ip}/24", DEFAULT_PORT, configured)
+        if not found:
+            return await self.async_step_connection()
+
+        choices = {host: host for host in found}
+        choices[DISCOVERY_MANUAL] = "Manual entry"
+        schema = {vol.Required(CONF_HOST, default=found[0]): vol.In(choices)}
+        return self.async_show_form(step_id="discovery", data_schema=vol.Schema(schema))
+
     async def async_step_connection(self, user_input=None):
         errors = {}
         if user_input is not None:
@@ -80,6 +122,12 @@ class CrowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(f"{host}_{port}")
             self._abort_if_unique_id_configured()
 
+            # Nur anlegen, wenn dort wirklich ein Crow IP Modul antwortet
+            timeout = user_input.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+            if not await async_probe(host, port, timeout):
+                errors["base"] = "cannot_connect"
+                return self._show_connection_form(user_input, errors)
+
             # --- Daten sicher zusammenbauen ---
             final_areas = {}
             for i in range(1, 3):
@@ -119,11 +167,14 @@ class CrowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
             return self.async_create_entry(title=host, data=data, options=options)
 
+        return self._show_connection_form({CONF_HOST: self.discovered_host}, errors)
+
+    def _show_connection_form(self, values, errors):
         data_schema = vol.Schema({
-            vol.Required(CONF_HOST): str,
-            vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-            vol.Optional(CONF_KEEP_ALIVE, default=DEFAULT_KEEPALIVE): int,
-            vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
+            vol.Required(CONF_HOST, description={"suggested_value": values.get(CONF_HOST)}): str,
+            vol.Optional(CONF_PORT, default=values.get(CONF_PORT, DEFAULT_PORT)): int,
+            vol.Optional(CONF_KEEP_ALIVE, default=values.get(CONF_KEEP_ALIVE, DEFAULT_KEEPALIVE)): int,
+            vol.Optional(CONF_TIMEOUT, default=values.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)): int,
         })
         return self.async_show_form(step_id="connection", data_schema=data_schema, errors=errors)
 
@@ -143,6 +194,7 @@ class CrowOptionsFlowHandler(config_entries.OptionsFlow):
         self.config_entry = config_entry
         self.areas_input = {}
         self.outputs_input = {}
+        self.zones_input = {}
 
     async def async_step_init(self, user_input=None):
         return await self.async_step_areas()
@@ -194,6 +246,37 @@ class CrowOptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(step_id="outputs", data_schema=vol.Schema(schema))
 
     async def async_step_zones(self, user_input=None):
+        if user_input is not None:
+            self.zones_input = user_input
+            return await self.async_step_advanced()
+
+        all_zones = self.config_entry.options.get(CONF_ZONES)
+        if all_zones is None:
+            all_zones = {}
+            
+        schema = {}
+        for i in range(1, 17):
+            zone_data = all_zones.get(str(i))
+            if zone_data is None:
+                zone_data = {}
+            
+            default_name = zone_data.get("name", "")
+            raw_type = zone_data.get("type", "motion")
+            
+            # WICHTIGE Valdierung: Wenn der Typ in der YAML falsch war,
+            # stürzt das Dropdown ab. Wir fangen das ab.
+            if raw_type not in ZONE_TYPES:
+                raw_type = "motion"
+                
+            schema[vol.Optional(f"zone_{i}_name", description={"suggested_value": default_name})] = str
+            schema[vol.Optional(f"zone_{i}_type", default=raw_type)] = vol.In(ZONE_TYPES)
+            schema[vol.Optional(
+                f"zone_{i}_supervision", default=zone_data.get(CONF_SUPERVISION, DEFAULT_SUPERVISION)
+            )] = vol.All(vol.Coerce(int), vol.Range(min=0))
+            
+        return self.async_show_form(step_id="zones", data_schema=vol.Schema(schema))
+
+    async def async_step_advanced(self, user_input=None):
         if user_input is not None:
             # Speichern der Daten
             areas_config = {}
@@ -214,38 +297,39 @@ class CrowOptionsFlowHandler(config_entries.OptionsFlow):
 
             zones_config = {}
             for i in range(1, 17):
-                name = user_input.get(f"zone_{i}_name")
-                if name: 
+                name = self.zones_input.get(f"zone_{i}_name")
+                supervision = self.zones_input.get(f"zone_{i}_supervision", DEFAULT_SUPERVISION)
+                if name or supervision:
                     zones_config[str(i)] = {
-                        "name": name, 
-                        "type": user_input.get(f"zone_{i}_type", "motion")
+                        "type": self.zones_input.get(f"zone_{i}_type", "motion"),
+                        CONF_SUPERVISION: supervision,
                     }
+                    if name:
+                        zones_config[str(i)]["name"] = name
 
             return self.async_create_entry(title="", data={
                 CONF_AREAS: areas_config, 
                 CONF_ZONES: zones_config, 
-                CONF_OUTPUTS: outputs_config
+                CONF_OUTPUTS: outputs_config,
+                CONF_MQTT_EXPORT: user_input.get(CONF_MQTT_EXPORT, False),
+                CONF_MQTT_PREFIX: user_input.get(CONF_MQTT_PREFIX, ""),
+                CONF_RELAYS: user_input.get(CONF_RELAYS, []),
+                CONF_RETIRE_AFTER: user_input.get(CONF_RETIRE_AFTER, DEFAULT_RETIRE_AFTER),
+                CONF_PULSE_LENGTH: user_input.get(CONF_PULSE_LENGTH, DEFAULT_PULSE_LENGTH),
             })
 
-        all_zones = self.config_entry.options.get(CONF_ZONES)
-        if all_zones is None:
-            all_zones = {}
-            
-        schema = {}
-        for i in range(1, 17):
-            zone_data = all_zones.get(str(i))
-            if zone_data is None:
-                zone_data = {}
-            
-            default_name = zone_data.get("name", "")
-            raw_type = zone_data.get("type", "motion")
-            
-            # WICHTIGE Valdierung: Wenn der Typ in der YAML falsch war,
-            # stürzt das Dropdown ab. Wir fangen das ab.
-            if raw_type not in ZONE_TYPES:
-                raw_type = "motion"
-                
-            schema[vol.Optional(f"zone_{i}_name", description={"suggested_value": default_name})] = str
-            schema[vol.Optional(f"zone_{i}_type", default=raw_type)] = vol.In(ZONE_TYPES)
-            
-        return self.async_show_form(step_id="zones", data_schema=vol.Schema(schema))
+        options = self.config_entry.options
+        schema = {
+            vol.Optional(CONF_MQTT_EXPORT, default=options.get(CONF_MQTT_EXPORT, False)): bool,
+            vol.Optional(CONF_MQTT_PREFIX, description={"suggested_value": options.get(CONF_MQTT_PREFIX, "")}): str,
+            vol.Optional(CONF_RELAYS, default=options.get(CONF_RELAYS, DEFAULT_RELAYS)): cv.multi_select(
+                {"1": "Relay 1", "2": "Relay 2"}
+            ),
+            vol.Optional(CONF_PULSE_LENGTH, default=options.get(CONF_PULSE_LENGTH, DEFAULT_PULSE_LENGTH)): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1, max=600)
+            ),
+            vol.Optional(CONF_RETIRE_AFTER, default=options.get(CONF_RETIRE_AFTER, DEFAULT_RETIRE_AFTER)): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+        }
+        return self.async_show_form(step_id="advanced", data_schema=vol.Schema(schema))
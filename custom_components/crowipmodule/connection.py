@@ -0,0 +1,218 @@
+"""Start and bounded teardown of the Crow library connection."""
+import asyncio
+import logging
+import math
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, ADMISSION_SCAN_TIME, STOP_FLUSH_TIMEOUT, STOP_TIMEOUT
+from .fleet import async_get_fleet_scheduler, reconnect_delay
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_close_client(client) -> None:
+    """Flush, close and cancel everything on the library's own event loop."""
+    loop = asyncio.get_running_loop()
+    client._shutdown = True  # pylint: disable=protected-access
+    client._connected = False  # pylint: disable=protected-access
+
+    transport = client._transport  # pylint: disable=protected-access
+    if transport is not None and not transport.is_closing():
+        # Noch gepufferte Befehle (z.B. letztes ARM/KEYS) rausschreiben lassen
+        flush_deadline = loop.time() + STOP_FLUSH_TIMEOUT
+        while transport.get_write_buffer_size() and loop.time() < flush_deadline:
+            await asyncio.sleep(0.05)
+        if transport.get_write_buffer_size():
+            transport.abort()
+        else:
+            transport.close()
+
+    # connect(), keep_alive() und reconnect() der Lib abbrechen
+    tasks = [task for task in asyncio.all_tasks(loop) if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.wait(tasks, timeout=STOP_FLUSH_TIMEOUT)
+
+
+class CrowConnection:
+    """Runs the library in the executor and tears it down with a hard deadline.
+
+    pycrowipmodule runs its own event loop inside controller.start(), which
+    blocks an executor thread until controller.stop() ends that loop. The
+    start and every reconnect pass the fleet admission queue first; reconnects
+    use jittered exponential backoff instead of the library's fixed delay, and
+    keepalives are sent at the panel's phase of the interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, controller, entry_id) -> None:
+        self._hass = hass
+        self._controller = controller
+        self._entry_id = entry_id
+        self._fleet = async_get_fleet_scheduler(hass)
+        self._remove_phase = None
+        self._starter = None
+        self._runner = None
+        self._stopping = None
+        self._settled = asyncio.Event()
+        self._connected = False
+        self._listeners = []
+        self._client = None
+        self._attempt = 0
+
+    def start(self) -> None:
+        """Queue the start in the admission queue without waiting for it."""
+        self._remove_phase = self._fleet.async_add_panel(self._entry_id)
+        self._starter = self._hass.async_create_background_task(
+            self._async_start(), f"{DOMAIN} start {self._controller.host}"
+        )
+
+    async def _async_start(self) -> None:
+        await self._fleet.async_admit(self._controller.keepalive_interval)
+        try:
+            self._runner = self._hass.async_add_executor_job(self._run_library)
+            try:
+                await asyncio.wait_for(
+                    self._settled.wait(), self._controller.connection_timeout + ADMISSION_SCAN_TIME
+                )
+            except asyncio.TimeoutError:
+                return
+            if self._connected:
+                # Slot für die Antwort auf den ersten STATUS-Scan behalten
+                await asyncio.sleep(ADMISSION_SCAN_TIME)
+        finally:
+            self._fleet.release()
+
+    def _run_library(self) -> None:
+        """controller.start() with our reconnect and keepalive. Blocks until stopped."""
+        from pycrowipmodule import CrowIPModuleClient  # pylint: disable=import-outside-toplevel
+
+        # Wie controller.start(), aber die Overrides stehen, bevor der Client läuft
+        client = CrowIPModuleClient(self._controller, self._controller._eventLoop)  # pylint: disable=protected-access
+        client.reconnect = self._reconnect
+        client.keep_alive = self._keep_alive
+        self._client = client
+        self._controller._client = client  # pylint: disable=protected-access
+        client.start()
+
+    def connected(self) -> None:
+        """Library callback: connection established. Called from the library thread."""
+        self._attempt = 0
+        self._hass.loop.call_soon_threadsafe(self._settle, True)
+
+    def connect_failed(self) -> None:
+        """Library callback: connection attempt failed. Called from the library thread."""
+        self._hass.loop.call_soon_threadsafe(self._settle, False)
+
+    @callback
+    def async_add_listener(self, listener):
+        """Call listener(connected) on every connect and disconnect. Return a remove function."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+        return _remove
+
+    @callback
+    def _settle(self, connected) -> None:
+        self._settled.set()
+        if connected == self._connected:
+            return
+        self._connected = connected
+        for listener in list(self._listeners):
+            listener(connected)
+
+    async def _keep_alive(self) -> None:
+        """Keepalive of the library client. Runs on the library's event loop."""
+        client = self._client
+        loop = asyncio.get_running_loop()
+        sent = loop.time()
+        while not client._shutdown:  # pylint: disable=protected-access
+            interval = self._controller.keepalive_interval
+            offset = self._fleet.keepalive_phase(self._entry_id) * interval
+            # Nächster Phasenpunkt nach einer halben Periode; alle Loops der
+            # Lib laufen auf derselben monotonen Uhr
+            earliest = max(loop.time(), sent + interval / 2)
+            sent = offset + math.ceil((earliest - offset) / interval) * interval
+            await asyncio.sleep(sent - loop.time())
+            if client._connected:  # pylint: disable=protected-access
+                client.send_command("status", "")
+
+    async def _reconnect(self, delay) -> None:
+        """Reconnect of the library client. Runs on the library's event loop."""
+        client = self._client
+        client.disconnect()
+        self._hass.loop.call_soon_threadsafe(self._settle, False)
+        self._attempt += 1
+        await asyncio.sleep(reconnect_delay(delay, self._attempt))
+
+        admitted = asyncio.run_coroutine_threadsafe(
+            self._fleet.async_admit(self._controller.keepalive_interval), self._hass.loop
+        )
+        try:
+            await asyncio.wrap_future(admitted)
+        except asyncio.CancelledError:
+            if admitted.done() and not admitted.cancelled():
+                self._hass.loop.call_soon_threadsafe(self._fleet.release)
+            raise
+        try:
+            await client.connect()
+        finally:
+            self._hass.loop.call_soon_threadsafe(self._fleet.release)
+
+    async def async_stop(self) -> None:
+        """Stop the library, never waiting longer than STOP_TIMEOUT."""
+        if self._stopping is None:
+            self._stopping = self._hass.async_create_task(self._async_stop())
+        await self._stopping
+
+    async def _async_stop(self) -> None:
+        if self._remove_phase is not None:
+            self._remove_phase()
+            self._remove_phase = None
+        if self._starter is not None and not self._starter.done():
+            self._starter.cancel()
+            await asyncio.wait([self._starter])
+        if self._runner is None:
+            return
+        started = time.monotonic()
+        deadline = started + STOP_TIMEOUT
+
+        # start() legt den Client erst im Executor an
+        client = getattr(self._controller, "_client", None)
+        while client is None and not self._runner.done() and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            client = getattr(self._controller, "_client", None)
+        if client is None:
+            return
+
+        library_loop = client._eventLoop  # pylint: disable=protected-access
+        try:
+            if library_loop.is_running():
+                await asyncio.wait_for(
+                    asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(_async_close_client(client), library_loop)
+                    ),
+                    max(deadline - time.monotonic(), 0),
+                )
+        except (asyncio.TimeoutError, RuntimeError) as err:
+            _LOGGER.warning("Crow IP Module did not close cleanly: %r", err)
+
+        # Beendet run_forever() der Lib (nicht blockierend)
+        if not library_loop.is_closed():
+            self._controller.stop()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._runner), max(deadline - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Crow IP Module thread still running after %ss, continuing without it",
+                STOP_TIMEOUT,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Crow IP Module thread ended with %r", err)
+        _LOGGER.debug("Teardown of %s took %.3fs", self._controller.host, time.monotonic() - started)
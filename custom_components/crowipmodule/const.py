@@ -2,11 +2,21 @@
 
 DOMAIN = "crowipmodule"
 DATA_CRW = "crowipmodule"
+DATA_DEADLINE_TIMER = "crowipmodule_deadline_timer"
+DATA_SUMMARY_TOTALS = "crowipmodule_summary_totals"
+DATA_FLEET_SCHEDULER = "crowipmodule_fleet_scheduler"
+DATA_SUPERVISOR = "crowipmodule_supervisor"
 
 CONF_KEEP_ALIVE = "keepalive_interval"
 CONF_AREAS = "areas"
 CONF_ZONES = "zones"
 CONF_OUTPUTS = "outputs"
+CONF_MQTT_EXPORT = "mqtt_export"
+CONF_MQTT_PREFIX = "mqtt_prefix"
+CONF_RELAYS = "relays"
+CONF_RETIRE_AFTER = "retire_after"
+CONF_PULSE_LENGTH = "pulse_length"
+CONF_SUPERVISION = "supervision"
 
 # System status sensors
 CONF_OBJ_MAINS = "mains"
@@ -19,9 +29,60 @@ CONF_OBJ_ZONE_BATTERY = "zonebattery"
 DEFAULT_PORT = 5002
 DEFAULT_TIMEOUT = 10
 DEFAULT_KEEPALIVE = 60
+DEFAULT_MQTT_PREFIX = "crowipmodule"
+DEFAULT_RELAYS = ["1", "2"]
+DEFAULT_RETIRE_AFTER = 0
+DEFAULT_PULSE_LENGTH = 1.0
+DEFAULT_SUPERVISION = 0
+
+SERVICE_PULSE = "pulse"
+ATTR_COUNT = "count"
+MAX_PULSE_COUNT = 20
+
+# State export: changes within this window (sec) are published together
+EXPORT_BATCH_WINDOW = 0.5
 
 SIGNAL_ZONE_UPDATE = "crowipmodule.zones_updated"
 SIGNAL_AREA_UPDATE = "crowipmodule.areas_updated"
 SIGNAL_SYSTEM_UPDATE = "crowipmodule.system_updated"
 SIGNAL_OUTPUT_UPDATE = "crowipmodule.output_updated"
 SIGNAL_KEYPAD_UPDATE = "crowipmodule.keypad_updated"
+SIGNAL_NEW_OBJECT = "crowipmodule.new_object"
+SIGNAL_SUMMARY_UPDATE = "crowipmodule.summary_updated"
+SIGNAL_SUPERVISION_UPDATE = "crowipmodule.supervision_updated"
+
+# Delay (sec) before changed last-seen times are written to .storage
+TRACKER_SAVE_DELAY = 60
+
+# Max. number of transitions kept in the in-memory timeline
+TIMELINE_MAX_EVENTS = 10000
+
+# Discovery of IP modules in the local /24 (sec / parallel probes). Hosts
+# that do not answer cost one connect timeout, so the 254 hosts take four
+# waves of 64 probes (2 s) and fit into the budget.
+DISCOVERY_TIMEOUT = 3.0
+DISCOVERY_CONNECT_TIMEOUT = 0.5
+DISCOVERY_PROBE_TIMEOUT = 1.0
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_MANUAL = "manual"
+
+# Fleet admission: parallel connects, max. gap between starts, time kept for
+# the initial status scan, upper bound of the reconnect backoff (sec)
+ADMISSION_CONCURRENCY = 4
+ADMISSION_MAX_SPACING = 0.5
+ADMISSION_SCAN_TIME = 1.0
+RECONNECT_MAX_DELAY = 300
+
+# Teardown: max. time (sec) to flush pending commands / for the whole stop
+STOP_FLUSH_TIMEOUT = 1.0
+STOP_TIMEOUT = 5.0
+
+# Event priorities (lower value = delivered first)
+PRIORITY_URGENT = 0
+PRIORITY_ROUTINE = 1
+
+# Zone types whose transitions overtake routine updates
+URGENT_ZONE_TYPES = ("smoke", "gas", "co")
+
+# Max. number of routine updates delivered per loop iteration
+DISPATCH_BATCH_SIZE = 32
@@ -0,0 +1,80 @@
+"""Network discovery of Crow/AAP IP Modules."""
+import asyncio
+import ipaddress
+import logging
+import re
+
+from .const import (
+    DISCOVERY_CONCURRENCY, DISCOVERY_CONNECT_TIMEOUT, DISCOVERY_PROBE_TIMEOUT,
+    DISCOVERY_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Antworten des Moduls auf STATUS (siehe pycrowipmodule.crow_defs)
+STATUS_LINE = re.compile(
+    r"^(RO|NR|M[FR]|B[FR]|T[FR]|L[FR]|D[FRAB]|[AS][AB]|E[AS][AB]|F[FR]"
+    r"|Z(?:BYR?|T[AR]|[OCAR])\d+|O[OC]\d+)$"
+)
+
+
+def _is_crow_response(data: bytes) -> bool:
+    try:
+        lines = data.decode("ascii").split("\r\n")
+    except UnicodeDecodeError:
+        return False
+    return any(STATUS_LINE.match(line.strip()) for line in lines)
+
+
+async def async_probe(host, port, timeout=DISCOVERY_PROBE_TIMEOUT, connect_timeout=None) -> bool:
+    """Return True if a Crow/AAP IP Module answers STATUS on host:port.
+
+    connect_timeout defaults to timeout, which then limits the answer.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port),
+            timeout if connect_timeout is None else connect_timeout,
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    try:
+        writer.write(b"STATUS \r\n")
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(512), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        writer.close()
+    return _is_crow_response(data)
+
+
+async def async_discover(network, port, exclude=()) -> list:
+    """Probe all hosts of an IPv4 network concurrently.
+
+    At most DISCOVERY_CONCURRENCY probes are in flight, each giving up on
+    the connect after DISCOVERY_CONNECT_TIMEOUT; whatever has not answered
+    after DISCOVERY_TIMEOUT seconds is cancelled.
+    """
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def _probe(host):
+        async with semaphore:
+            found = await async_probe(host, port, connect_timeout=DISCOVERY_CONNECT_TIMEOUT)
+            return host if found else None
+
+    tasks = [
+        asyncio.create_task(_probe(str(host)))
+        for host in ipaddress.ip_network(network, strict=False).hosts()
+        if str(host) not in exclude
+    ]
+    if not tasks:
+        return []
+    done, pending = await asyncio.wait(tasks, timeout=DISCOVERY_TIMEOUT)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        _LOGGER.debug("Discovery budget exhausted, %d hosts not probed", len(pending))
+    found = [task.result() for task in done if task.result()]
+    return sorted(found, key=ipaddress.ip_address)
@@ -0,0 +1,59 @@
+"""Shared entity helpers for the Crow IP Module integration."""
+from dataclasses import dataclass, field
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from .const import DOMAIN
+from .connection import CrowConnection
+from .priority import CrowEventQueue, entry_signal
+from .summary import CrowSiteSummary
+from .supervision import CrowZoneSupervision
+from .timeline import CrowTimeline
+from .tracker import CrowObjectTracker
+
+
+@dataclass
+class CrowData:
+    """Runtime data of one config entry (hass.data[DOMAIN][entry_id])."""
+
+    entry_id: str
+    controller: object
+    connection: CrowConnection
+    device_info: DeviceInfo
+    tracker: CrowObjectTracker
+    timeline: CrowTimeline
+    summary: CrowSiteSummary
+    supervision: CrowZoneSupervision
+    event_queue: CrowEventQueue
+    # entity_id -> CrowRelay, Ziele des Dienstes crowipmodule.pulse
+    relays: dict = field(default_factory=dict)
+
+
+def build_device_info(host) -> DeviceInfo:
+    """Build the device description shared by all entities of an entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, "crow_alarm_panel")},
+        name="Crow Alarm System",
+        manufacturer="Crow/AAP",
+        model="IP Module",
+        configuration_url=f"http://{host}",
+    )
+
+
+class CrowEntity(Entity):
+    """Basisklasse für alle Crow Entities."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, data: CrowData) -> None:
+        self._entry_id = data.entry_id
+        self._controller = data.controller
+        self._attr_device_info = data.device_info
+
+    def _async_subscribe(self, signal, target) -> None:
+        """Connect target to a signal of this entry until the entity is removed."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, entry_signal(signal, self._entry_id), target)
+        )
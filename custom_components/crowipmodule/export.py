@@ -0,0 +1,155 @@
+"""Export of Crow panel state to an MQTT broker."""
+import json
+import logging
+
+from homeassistant.components import mqtt
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE,
+    SIGNAL_SYSTEM_UPDATE, SIGNAL_OUTPUT_UPDATE,
+    EXPORT_BATCH_WINDOW,
+)
+from .priority import area_number, entry_signal
+
+_LOGGER = logging.getLogger(__name__)
+
+# Signal -> (Topic-Name, Attribut des Controllers)
+EXPORTED_STATES = {
+    SIGNAL_ZONE_UPDATE: ("zone", "zone_state"),
+    SIGNAL_AREA_UPDATE: ("area", "area_state"),
+    SIGNAL_OUTPUT_UPDATE: ("output", "output_state"),
+}
+EXPORTED_STATES_BY_NAME = dict(EXPORTED_STATES.values())
+
+
+def _encode(status) -> str:
+    return json.dumps(status, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class CrowMqttExporter:
+    """Publish zone, area, output and system state as retained MQTT messages.
+
+    Updates are collected for EXPORT_BATCH_WINDOW seconds and then published
+    in one cycle; topics whose payload did not change are skipped. Topics
+    that could not be published stay dirty until the broker is back. After
+    the MQTT client (re)connects a single retained snapshot of the whole
+    panel is published to <prefix>/snapshot.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id, controller, prefix) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._controller = controller
+        self._prefix = prefix.rstrip("/")
+        self._dirty = set()
+        self._published = {}
+        self._cancel_flush = None
+        self._unsubs = []
+
+    async def async_start(self) -> bool:
+        """Wait for MQTT, then connect to the dispatcher signals.
+
+        Runs as a background task of the entry; returns False if MQTT is missing.
+        """
+        if not await mqtt.async_wait_for_mqtt_client(self._hass):
+            _LOGGER.warning("MQTT is not available, Crow state export disabled")
+            return False
+
+        for signal in (*EXPORTED_STATES, SIGNAL_SYSTEM_UPDATE):
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self._hass, entry_signal(signal, self._entry_id), self._listener(signal)
+                )
+            )
+        self._unsubs.append(
+            mqtt.async_subscribe_connection_status(self._hass, self._connection_changed)
+        )
+        if mqtt.is_connected(self._hass):
+            self._connection_changed(True)
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Disconnect from all signals and drop pending changes."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._dirty.clear()
+
+    def _listener(self, signal):
+        @callback
+        def _updated(data) -> None:
+            self._mark(signal, data)
+        return _updated
+
+    @callback
+    def _mark(self, signal, data) -> None:
+        """Remember a changed object and schedule the next publish cycle."""
+        if signal == SIGNAL_SYSTEM_UPDATE:
+            self._dirty.add(("system", None))
+        else:
+            name, attr = EXPORTED_STATES[signal]
+            if data is None:
+                self._dirty.update((name, num) for num in getattr(self._controller, attr))
+            else:
+                num = area_number(data) if signal == SIGNAL_AREA_UPDATE else int(data)
+                self._dirty.add((name, num))
+
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, EXPORT_BATCH_WINDOW, self._flush
+            )
+
+    def _status(self, name, num):
+        if name == "system":
+            return self._controller.system_state.get("status", {})
+        state = getattr(self._controller, EXPORTED_STATES_BY_NAME[name])
+        return state.get(num, {}).get("status", {})
+
+    async def _flush(self, _now) -> None:
+        """Publish every changed topic of the current batch."""
+        self._cancel_flush = None
+        dirty, self._dirty = self._dirty, set()
+        pending = list(dirty)
+        while pending:
+            name, num = pending[-1]
+            topic = f"{self._prefix}/{name}" if num is None else f"{self._prefix}/{name}/{num}"
+            payload = _encode(self._status(name, num))
+            if self._published.get(topic) != payload:
+                try:
+                    await mqtt.async_publish(self._hass, topic, payload, retain=True)
+                except HomeAssistantError as err:
+                    # Rest des Batches nach dem Reconnect erneut senden
+                    _LOGGER.debug("Crow state export paused: %s", err)
+                    self._dirty.update(pending)
+                    return
+                self._published[topic] = payload
+            pending.pop()
+
+    @callback
+    def _connection_changed(self, connected) -> None:
+        if not connected:
+            return
+        self._hass.async_create_task(self._publish_snapshot())
+        if self._dirty and self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, EXPORT_BATCH_WINDOW, self._flush
+            )
+
+    async def _publish_snapshot(self) -> None:
+        """Publish the full panel state as one compact retained message."""
+        snapshot = {"system": self._controller.system_state.get("status", {})}
+        for name, attr in EXPORTED_STATES.values():
+            snapshot[name] = {
+                str(num): info.get("status", {})
+                for num, info in getattr(self._controller, attr).items()
+            }
+        await mqtt.async_publish(
+            self._hass, f"{self._prefix}/snapshot", _encode(snapshot), retain=True
+        )
@@ -0,0 +1,93 @@
+"""Admission control for connections of many Crow panels."""
+import asyncio
+import logging
+import random
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN, DATA_FLEET_SCHEDULER,
+    ADMISSION_CONCURRENCY, ADMISSION_MAX_SPACING,
+    RECONNECT_MAX_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_fleet_scheduler(hass: HomeAssistant) -> "CrowFleetScheduler":
+    """Return the scheduler shared by all config entries."""
+    if DATA_FLEET_SCHEDULER not in hass.data:
+        hass.data[DATA_FLEET_SCHEDULER] = CrowFleetScheduler(hass)
+    return hass.data[DATA_FLEET_SCHEDULER]
+
+
+def reconnect_delay(base, attempt) -> float:
+    """Exponential backoff with full jitter, so panels do not reconnect in lockstep."""
+    return random.uniform(0, min(RECONNECT_MAX_DELAY, base * 2 ** min(attempt, 6)))
+
+
+class CrowFleetScheduler:
+    """Concurrency-limited, spaced admission queue for connection attempts.
+
+    At most ADMISSION_CONCURRENCY panels connect and run their initial status
+    scan at the same time, and consecutive admissions are spaced by
+    keepalive / number of panels (capped at ADMISSION_MAX_SPACING).
+    Independently of admission, panel i of N sends its keepalive at i/N of
+    the interval, so the keepalives of the fleet never fire in lockstep.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(ADMISSION_CONCURRENCY)
+        self._next_slot = 0.0
+        self._panels = set()
+        # entry_id -> Anteil am Keepalive-Intervall; wird nur ersetzt, nie verändert
+        self._phases = {}
+
+    def spacing(self, keep_alive) -> float:
+        panels = max(len(self._hass.config_entries.async_entries(DOMAIN)), 1)
+        return min(keep_alive / panels, ADMISSION_MAX_SPACING)
+
+    async def async_admit(self, keep_alive) -> None:
+        """Wait for an admission slot. The caller must call release() afterwards."""
+        await self._semaphore.acquire()
+        try:
+            loop = self._hass.loop
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.spacing(keep_alive)
+            if slot > now:
+                await asyncio.sleep(slot - now)
+        except asyncio.CancelledError:
+            self._semaphore.release()
+            raise
+
+    @callback
+    def release(self) -> None:
+        self._semaphore.release()
+
+    @callback
+    def async_add_panel(self, entry_id):
+        """Give entry_id a keepalive phase. Return a function that removes it."""
+        self._panels.add(entry_id)
+        self._update_phases()
+
+        @callback
+        def _remove() -> None:
+            self._panels.discard(entry_id)
+            self._update_phases()
+        return _remove
+
+    def keepalive_phase(self, entry_id) -> float:
+        """Fraction of the keepalive interval at which entry_id sends. Safe from any thread."""
+        return self._phases.get(entry_id, 0.0)
+
+    @callback
+    def _update_phases(self) -> None:
+        # Reihenfolge der Config Entries: ein Reload behält seine Phase
+        order = [
+            entry.entry_id for entry in self._hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id in self._panels
+        ]
+        self._phases = {entry_id: index / len(order) for index, entry_id in enumerate(order)}
@@ -0,0 +1,133 @@
+"""Strict-priority delivery of Crow panel updates to Home Assistant."""
+from collections import deque
+import logging
+import threading
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    CONF_ZONES, CONF_OBJ_MAINS, CONF_OBJ_TAMPER,
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, SIGNAL_SYSTEM_UPDATE,
+    PRIORITY_URGENT, PRIORITY_ROUTINE, URGENT_ZONE_TYPES,
+    DISPATCH_BATCH_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+AREA_LETTERS = {"A": 1, "B": 2}
+
+
+def entry_signal(signal, entry_id) -> str:
+    """Dispatcher signal of one config entry, so panels never cross-feed."""
+    return f"{signal}_{entry_id}"
+
+
+def area_number(area):
+    """Normalise an area reported as 'A'/'B' or number to its int."""
+    if area in AREA_LETTERS:
+        return AREA_LETTERS[area]
+    return int(area)
+
+
+class CrowEventQueue:
+    """Two-lane queue between the library thread and the event loop.
+
+    Updates are classified when the library reports them. Urgent updates
+    (area alarm, system tamper, mains loss, smoke/gas/co zones) are always
+    delivered before any routine update; duplicate routine updates that are
+    still waiting are coalesced, since entities re-read the state dicts anyway.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id, controller, options) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._controller = controller
+        self._urgent_zones = {
+            int(num)
+            for num, info in options.get(CONF_ZONES, {}).items()
+            if info.get("type") in URGENT_ZONE_TYPES
+        }
+        self._lanes = (deque(), deque())
+        self._waiting = set()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._closed = False
+        # Letzter bekannter Stand der kritischen Flags (nur Übergänge sind dringend)
+        self._area_alarm = {}
+        self._system_flags = None
+
+    def submit(self, signal, data) -> None:
+        """Queue an update. Called from the library thread."""
+        priority = self._classify(signal, data)
+        with self._lock:
+            if self._closed:
+                return
+            if priority == PRIORITY_ROUTINE:
+                if (signal, data) in self._waiting:
+                    return
+                self._waiting.add((signal, data))
+            self._lanes[priority].append((signal, data))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._hass.loop.call_soon_threadsafe(self._drain)
+
+    def close(self) -> None:
+        """Drop queued updates and ignore late callbacks of a stopped controller."""
+        with self._lock:
+            self._closed = True
+            for lane in self._lanes:
+                lane.clear()
+            self._waiting.clear()
+
+    def _classify(self, signal, data) -> int:
+        """Return the lane for an update."""
+        if signal == SIGNAL_ZONE_UPDATE:
+            if data is not None and int(data) in self._urgent_zones:
+                return PRIORITY_URGENT
+            return PRIORITY_ROUTINE
+
+        if signal == SIGNAL_AREA_UPDATE:
+            if data is None:
+                return PRIORITY_ROUTINE
+            number = area_number(data)
+            info = self._controller.area_state.get(number, {})
+            alarm = bool(info.get("status", {}).get("alarm"))
+            if self._area_alarm.get(number, False) != alarm:
+                self._area_alarm[number] = alarm
+                return PRIORITY_URGENT
+            return PRIORITY_ROUTINE
+
+        if signal == SIGNAL_SYSTEM_UPDATE:
+            status = self._controller.system_state.get("status", {})
+            flags = (status.get(CONF_OBJ_TAMPER, True), status.get(CONF_OBJ_MAINS, True))
+            if flags != self._system_flags:
+                self._system_flags = flags
+                return PRIORITY_URGENT
+            return PRIORITY_ROUTINE
+
+        return PRIORITY_ROUTINE
+
+    @callback
+    def _drain(self) -> None:
+        """Deliver queued updates, urgent lane first.
+
+        At most DISPATCH_BATCH_SIZE updates are sent per loop iteration so a
+        status resync cannot starve the loop; the urgent lane is re-checked
+        before every single routine update.
+        """
+        urgent, routine = self._lanes
+        for _ in range(DISPATCH_BATCH_SIZE):
+            with self._lock:
+                if urgent:
+                    item = urgent.popleft()
+                elif routine:
+                    item = routine.popleft()
+                    self._waiting.discard(item)
+                else:
+                    self._scheduled = False
+                    return
+            signal, data = item
+            async_dispatcher_send(self._hass, entry_signal(signal, self._entry_id), data)
+        self._hass.loop.call_soon(self._drain)
@@ -5,18 +5,32 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.const import CONF_HOST, EntityCategory # Für Diagnostik, falls wir den Text-Sensor auch so wollen
 
 from .const import (
     DOMAIN,
     DATA_CRW,
     SIGNAL_SYSTEM_UPDATE,
+    SIGNAL_SUMMARY_UPDATE,
+)
+from .entity import CrowEntity
+from .priority import entry_signal
+from .summary import (
+    SUMMARY_OPEN_ZONES, SUMMARY_BYPASSED_ZONES,
+    SUMMARY_ALARM_ZONES, SUMMARY_AREAS_IN_ALARM,
+    async_get_totals,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# (Key, Name, Icon)
+SUMMARY_SENSORS = [
+    (SUMMARY_OPEN_ZONES, "Open Zones", "mdi:door-open"),
+    (SUMMARY_BYPASSED_ZONES, "Bypassed Zones", "mdi:shield-off-outline"),
+    (SUMMARY_ALARM_ZONES, "Zones in Alarm", "mdi:alarm-light"),
+    (SUMMARY_AREAS_IN_ALARM, "Areas in Alarm", "mdi:shield-alert"),
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,45 +38,49 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Crow IP Module sensor."""
-    controller = hass.data[DOMAIN][entry.entry_id]
-    host = entry.data[CONF_HOST]
-    
-    async_add_entities([CrowSystemSensor(controller, host)], True)
+    data = hass.data[DOMAIN][entry.entry_id]
+
+    entities = [CrowSystemSensor(data)]
+    for key, name, icon in SUMMARY_SENSORS:
+        entities.append(CrowSummarySensor(
+            data, data.summary, key, name, icon,
+            f"crow_summary_{entry.entry_id}_{key}", entry_signal(SIGNAL_SUMMARY_UPDATE, entry.entry_id),
+        ))
+    async_add_entities(entities)
+
+    # Summen über alle Zentralen legt ein Eintrag an; entlädt er, übernimmt ein anderer
+    totals = async_get_totals(hass)
+
+    @callback
+    def _add_totals():
+        async_add_entities([
+            CrowSummarySensor(
+                data, totals, key, f"{name} (All Panels)", icon,
+                f"crow_total_{key}", SIGNAL_SUMMARY_UPDATE,
+            )
+            for key, name, icon in SUMMARY_SENSORS
+        ])
+
+    entry.async_on_unload(totals.async_offer(entry.entry_id, _add_totals))
 
 
-class CrowSystemSensor(SensorEntity):
+class CrowSystemSensor(CrowEntity, SensorEntity):
     """Representation of the Crow Alarm System Status Text."""
-    
-    _attr_has_entity_name = True
 
-    def __init__(self, controller, host) -> None:
-        self._controller = controller
-        self._host = host
+    def __init__(self, data) -> None:
+        super().__init__(data)
         self._attr_name = "System Status"
         self._attr_unique_id = "crow_system_status_text"
         self._attr_icon = "mdi:shield-home"
-        self._info = controller.system_state
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, "crow_alarm_panel")},
-            name="Crow Alarm System",
-            manufacturer="Crow/AAP",
-            model="IP Module",
-            configuration_url=f"http://{self._host}",
-        )
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_SYSTEM_UPDATE, self._update_callback)
-        )
+        self._async_subscribe(SIGNAL_SYSTEM_UPDATE, self._update_callback)
 
     @property
     def native_value(self) -> str:
         """Return a text representation of the state."""
-        status = self._info.get("status", {})
+        status = self._controller.system_state.get("status", {})
         
         if status.get("alarm"):
             return "ALARM"
@@ -86,5 +104,39 @@ class CrowSystemSensor(SensorEntity):
     @callback
     def _update_callback(self, system) -> None:
         """Update the sensor state in HA."""
-        self._info = self._controller.system_state
+        self.async_write_ha_state()
+
+
+class CrowSummarySensor(CrowEntity, SensorEntity):
+    """Anzahl offener/überbrückter/alarmierter Zonen bzw. Bereiche im Alarm.
+
+    source is a CrowSiteSummary (one panel) or CrowSummaryTotals (all panels);
+    both are kept current incrementally, the sensor only reads them.
+    """
+
+    def __init__(self, data, source, key, name, icon, unique_id, signal) -> None:
+        super().__init__(data)
+        self._source = source
+        self._key = key
+        self._signal = signal
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = unique_id
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._signal, self._update_callback)
+        )
+
+    @property
+    def native_value(self) -> int:
+        return self._source.count(self._key)
+
+    @property
+    def extra_state_attributes(self):
+        return {"names": self._source.names(self._key)}
+
+    @callback
+    def _update_callback(self) -> None:
         self.async_write_ha_state()
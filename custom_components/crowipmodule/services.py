@@ -0,0 +1,52 @@
+"""Services of the Crow IP Module integration."""
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import DOMAIN, SERVICE_PULSE, ATTR_COUNT, MAX_PULSE_COUNT
+
+PULSE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Optional(ATTR_COUNT, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PULSE_COUNT))}
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services once for all config entries."""
+    hass.services.async_register(DOMAIN, SERVICE_PULSE, _async_pulse, schema=PULSE_SCHEMA)
+
+
+def _relays(hass: HomeAssistant):
+    """Return entity_id -> CrowRelay of all loaded entries."""
+    relays = {}
+    for data in hass.data.get(DOMAIN, {}).values():
+        relays.update(data.relays)
+    return relays
+
+
+async def _async_pulse(call: ServiceCall) -> None:
+    """Queue pulses on the targeted relays.
+
+    Outputs named explicitly are an error; outputs pulled in through a device
+    or area target are skipped, since only relays can pulse.
+    """
+    hass = call.hass
+    relays = _relays(hass)
+    selected = async_extract_referenced_entity_ids(hass, call)
+    not_relays = sorted(entity_id for entity_id in selected.referenced if entity_id not in relays)
+    if not_relays:
+        raise ServiceValidationError(
+            f"{', '.join(not_relays)} cannot pulse, only Crow relays can"
+        )
+    targets = [
+        relays[entity_id]
+        for entity_id in sorted(selected.referenced | selected.indirectly_referenced)
+        if entity_id in relays
+    ]
+    if not targets:
+        raise ServiceValidationError("No Crow relay targeted")
+    for relay in targets:
+        await relay.async_pulse(call.data[ATTR_COUNT])
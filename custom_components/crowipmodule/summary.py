@@ -0,0 +1,190 @@
+"""Incrementally maintained site summary of one or all Crow panels."""
+import logging
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+
+from .const import (
+    CONF_AREAS, CONF_ZONES, DATA_SUMMARY_TOTALS,
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, SIGNAL_SUMMARY_UPDATE,
+)
+from .priority import area_number, entry_signal
+
+_LOGGER = logging.getLogger(__name__)
+
+SUMMARY_OPEN_ZONES = "open_zones"
+SUMMARY_BYPASSED_ZONES = "bypassed_zones"
+SUMMARY_ALARM_ZONES = "alarm_zones"
+SUMMARY_AREAS_IN_ALARM = "areas_in_alarm"
+
+# Zonen-Summe -> Attribut im Zonen-Status der Lib
+ZONE_SUMMARIES = {
+    SUMMARY_OPEN_ZONES: "open",
+    SUMMARY_BYPASSED_ZONES: "bypass",
+    SUMMARY_ALARM_ZONES: "alarm",
+}
+SUMMARY_KEYS = (*ZONE_SUMMARIES, SUMMARY_AREAS_IN_ALARM)
+
+
+@callback
+def async_get_totals(hass: HomeAssistant) -> "CrowSummaryTotals":
+    """Return the summary across all config entries."""
+    if DATA_SUMMARY_TOTALS not in hass.data:
+        hass.data[DATA_SUMMARY_TOTALS] = CrowSummaryTotals(hass)
+    return hass.data[DATA_SUMMARY_TOTALS]
+
+
+class CrowSummaryTotals:
+    """Counters over all panels, adjusted by the per-panel summaries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self.counts = {key: 0 for key in SUMMARY_KEYS}
+        self.summaries = []
+        # Entry, dessen Sensor-Plattform die Gesamt-Sensoren angelegt hat
+        self.owner = None
+        # entry_id -> Callback, der die Gesamt-Sensoren in diesem Entry anlegt
+        self._candidates = {}
+
+    def count(self, key) -> int:
+        return self.counts[key]
+
+    def names(self, key):
+        """Return the names of all members of a summary on all panels."""
+        return [name for summary in self.summaries for name in summary.names(key)]
+
+    @callback
+    def async_offer(self, entry_id, add_sensors):
+        """Offer an entry's sensor platform to hold the all-panel sensors.
+
+        The first entry becomes the owner and add_sensors is called right
+        away. When the owner unloads, the next loaded entry adds them, so the
+        sensors stay as long as any panel is set up. Return a withdraw function.
+        """
+        self._candidates[entry_id] = add_sensors
+        if self.owner is None:
+            self._elect(entry_id)
+
+        @callback
+        def _withdraw() -> None:
+            del self._candidates[entry_id]
+            if self.owner != entry_id:
+                return
+            self.owner = None
+            for candidate in self._candidates:
+                entry = self._hass.config_entries.async_get_entry(candidate)
+                # Entries, die gerade selbst entladen werden, übernehmen nicht
+                if entry is not None and entry.state is ConfigEntryState.LOADED:
+                    self._elect(candidate)
+                    return
+        return _withdraw
+
+    @callback
+    def _elect(self, entry_id) -> None:
+        self.owner = entry_id
+        self._candidates[entry_id]()
+
+    @callback
+    def adjust(self, key, delta) -> None:
+        self.counts[key] += delta
+
+    @callback
+    def async_notify(self) -> None:
+        async_dispatcher_send(self._hass, SIGNAL_SUMMARY_UPDATE)
+
+
+class CrowSiteSummary:
+    """Open, bypassed and alarmed zones and areas in alarm of one panel.
+
+    Each zone or area update only re-checks that one object, so keeping the
+    summary current costs O(1) per event regardless of the number of zones.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry, controller) -> None:
+        self._hass = hass
+        self._entry_id = entry.entry_id
+        self._controller = controller
+        self._totals = async_get_totals(hass)
+        self._zone_names = {
+            int(num): info.get("name") or f"Zone {num}"
+            for num, info in entry.options.get(CONF_ZONES, {}).items()
+        }
+        self._area_names = {
+            int(num): info.get("name") or f"Area {num}"
+            for num, info in entry.options.get(CONF_AREAS, {}).items()
+        }
+        # Summe -> {Nummer: Name}, Reihenfolge = Reihenfolge des Auftretens
+        self.members = {key: {} for key in SUMMARY_KEYS}
+        self._unsubs = []
+
+    def count(self, key) -> int:
+        return len(self.members[key])
+
+    def names(self, key):
+        return list(self.members[key].values())
+
+    @callback
+    def async_start(self) -> None:
+        self._totals.summaries.append(self)
+        self._zone_updated(None)
+        self._area_updated(None)
+        self._unsubs.append(async_dispatcher_connect(
+            self._hass, entry_signal(SIGNAL_ZONE_UPDATE, self._entry_id), self._zone_updated
+        ))
+        self._unsubs.append(async_dispatcher_connect(
+            self._hass, entry_signal(SIGNAL_AREA_UPDATE, self._entry_id), self._area_updated
+        ))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening and remove this panel from the totals."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        for key, members in self.members.items():
+            self._totals.adjust(key, -len(members))
+            members.clear()
+        self._totals.summaries.remove(self)
+        self._totals.async_notify()
+
+    @callback
+    def _zone_updated(self, zone) -> None:
+        zones = self._controller.zone_state
+        numbers = zones if zone is None else (int(zone),)
+        changed = False
+        for num in numbers:
+            status = zones.get(num, {}).get("status", {})
+            name = self._zone_names.get(num, f"Zone {num}")
+            for key, attr in ZONE_SUMMARIES.items():
+                changed |= self._set(key, num, name, status.get(attr, False))
+        if changed:
+            self._notify()
+
+    @callback
+    def _area_updated(self, area) -> None:
+        areas = self._controller.area_state
+        numbers = areas if area is None else (area_number(area),)
+        changed = False
+        for num in numbers:
+            alarm = areas.get(num, {}).get("status", {}).get("alarm", False)
+            name = self._area_names.get(num, f"Area {num}")
+            changed |= self._set(SUMMARY_AREAS_IN_ALARM, num, name, alarm)
+        if changed:
+            self._notify()
+
+    def _set(self, key, num, name, present) -> bool:
+        members = self.members[key]
+        if bool(present) == (num in members):
+            return False
+        if present:
+            members[num] = name
+            self._totals.adjust(key, 1)
+        else:
+            del members[num]
+            self._totals.adjust(key, -1)
+        return True
+
+    @callback
+    def _notify(self) -> None:
+        async_dispatcher_send(self._hass, entry_signal(SIGNAL_SUMMARY_UPDATE, self._entry_id))
+        self._totals.async_notify()
@@ -0,0 +1,164 @@
+"""Supervision windows for silent or dead Crow zones."""
+from functools import partial
+from itertools import count
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    CONF_ZONES, CONF_SUPERVISION, DATA_SUPERVISOR, SIGNAL_SUPERVISION_UPDATE,
+)
+from .priority import entry_signal
+from .timer import async_get_deadline_timer
+from .tracker import KIND_ZONE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_supervisor(hass: HomeAssistant) -> "CrowSupervisor":
+    """Return the supervisor shared by all config entries."""
+    if DATA_SUPERVISOR not in hass.data:
+        hass.data[DATA_SUPERVISOR] = CrowSupervisor(hass)
+    return hass.data[DATA_SUPERVISOR]
+
+
+class CrowSupervisor:
+    """Supervision deadlines of all panels on the shared CrowDeadlineTimer.
+
+    A report only moves the zone's deadline in a dict. Each zone has at most
+    one timer entry; when it comes due and the deadline has moved in the
+    meantime, it is scheduled again at the new deadline. So a zone costs at
+    most one wakeup per window, no matter how often it reports.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._timer = async_get_deadline_timer(hass)
+        self._generation = count()
+        # key -> (Generation, Fenster, Callback)
+        self._watched = {}
+        self._deadlines = {}
+        # key -> Abbruch-Funktion des Timer-Eintrags
+        self._queued = {}
+
+    @callback
+    def async_watch(self, key, window, expired):
+        """Call expired when key is not seen for window seconds. Return an unwatch function."""
+        self._forget(key)
+        generation = next(self._generation)
+        self._watched[key] = (generation, window, expired)
+        self.async_seen(key)
+
+        @callback
+        def _unwatch() -> None:
+            # Nach einem Reload gehört der Key schon der neuen Überwachung
+            if self._watched.get(key, (None,))[0] == generation:
+                self._forget(key)
+        return _unwatch
+
+    @callback
+    def async_seen(self, key) -> None:
+        """Restart the window of key."""
+        if key not in self._watched:
+            return
+        deadline = self._hass.loop.time() + self._watched[key][1]
+        self._deadlines[key] = deadline
+        if key not in self._queued:
+            self._schedule(key, deadline)
+
+    @callback
+    def _forget(self, key) -> None:
+        self._watched.pop(key, None)
+        self._deadlines.pop(key, None)
+        cancel = self._queued.pop(key, None)
+        if cancel is not None:
+            cancel()
+
+    @callback
+    def _schedule(self, key, deadline) -> None:
+        generation = self._watched[key][0]
+        self._queued[key] = self._timer.async_call_at(
+            deadline, partial(self._due, key, generation)
+        )
+
+    @callback
+    def _due(self, key, generation) -> None:
+        watched = self._watched.get(key)
+        if watched is None or watched[0] != generation:
+            return
+        del self._queued[key]
+        deadline = self._deadlines[key]
+        if deadline > self._hass.loop.time():
+            # Zwischenzeitlich gemeldet: erst zur neuen Frist wieder prüfen
+            self._schedule(key, deadline)
+            return
+        del self._deadlines[key]
+        watched[2]()
+
+
+class CrowZoneSupervision:
+    """Zones of one panel that missed their supervision window.
+
+    Windows are configured per zone in minutes (0 = not supervised). The
+    window starts when the entry is set up and restarts with every change
+    the tracker reports for the zone; the status lines the panel repeats
+    for every keepalive do not count. A missed zone recovers with its next
+    change.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry, tracker) -> None:
+        self._hass = hass
+        self._entry_id = entry.entry_id
+        self._tracker = tracker
+        self._supervisor = async_get_supervisor(hass)
+        self.windows = {
+            int(num): info[CONF_SUPERVISION] * 60
+            for num, info in entry.options.get(CONF_ZONES, {}).items()
+            if info.get(CONF_SUPERVISION)
+        }
+        self.missed = set()
+        self._unsubs = []
+
+    def is_missed(self, num) -> bool:
+        return num in self.missed
+
+    @callback
+    def async_start(self) -> None:
+        if not self.windows:
+            return
+        for num, window in self.windows.items():
+            self._unsubs.append(self._supervisor.async_watch(
+                (self._entry_id, num), window, partial(self._expired, num)
+            ))
+        self._unsubs.append(self._tracker.async_add_listener(KIND_ZONE, self._zone_reported))
+
+    @callback
+    def async_stop(self) -> None:
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _zone_reported(self, num) -> None:
+        if num not in self.windows:
+            return
+        self._supervisor.async_seen((self._entry_id, num))
+        if num in self.missed:
+            self.missed.discard(num)
+            _LOGGER.info("Zone %s reports again", num)
+            self._notify(num)
+
+    @callback
+    def _expired(self, num) -> None:
+        _LOGGER.warning(
+            "Zone %s missed its supervision window of %s min", num, self.windows[num] // 60
+        )
+        self.missed.add(num)
+        self._notify(num)
+
+    @callback
+    def _notify(self, num) -> None:
+        async_dispatcher_send(
+            self._hass, entry_signal(SIGNAL_SUPERVISION_UPDATE, self._entry_id), num
+        )
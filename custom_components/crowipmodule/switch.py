@@ -6,15 +6,20 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.const import CONF_HOST
 
 from .const import (
     DOMAIN,
     SIGNAL_OUTPUT_UPDATE,
     CONF_OUTPUTS,
+    CONF_RELAYS,
+    CONF_PULSE_LENGTH,
+    DEFAULT_RELAYS,
+    DEFAULT_PULSE_LENGTH,
 )
+from .entity import CrowEntity
+from .timer import async_get_deadline_timer
+from .tracker import KIND_OUTPUT, new_object_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,52 +30,43 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Crow IP Module switches."""
-    controller = hass.data[DOMAIN][entry.entry_id]
+    data = hass.data[DOMAIN][entry.entry_id]
     options = entry.options
-    host = entry.data[CONF_HOST] # FIX
-    
-    entities = []
-
     configured_outputs = options.get(CONF_OUTPUTS, {})
-    
-    if not configured_outputs:
-         configured_outputs = {
-             "3": {"name": "Modem"},
-             "4": {"name": "Gatewayrouter"}
-         }
-
-    for output_num_str, output_data in configured_outputs.items():
-        output_num = int(output_num_str)
+
+    def _output(output_num):
+        output_data = configured_outputs.get(str(output_num), {})
         name = output_data.get("name", f"Output {output_num}")
-        entities.append(CrowOutput(controller, host, output_num, name))
+        return CrowOutput(data, output_num, name)
 
-    for relay_num in range(1, 3):
-        entities.append(CrowRelay(controller, host, relay_num))
+    # Konfigurierte Ausgänge sofort, andere erst, wenn die Zentrale sie schaltet.
+    # Neue kommen per Signal dazu.
+    entities = [_output(num) for num in data.tracker.known(KIND_OUTPUT)]
+
+    # Relais meldet die Zentrale nie, daher über die Optionen wählbar
+    scheduler = async_get_deadline_timer(hass)
+    pulse_length = options.get(CONF_PULSE_LENGTH, DEFAULT_PULSE_LENGTH)
+    for relay_num in options.get(CONF_RELAYS, DEFAULT_RELAYS):
+        entities.append(CrowRelay(data, int(relay_num), pulse_length, scheduler))
 
     async_add_entities(entities)
 
+    @callback
+    def _async_add_output(output_num):
+        async_add_entities([_output(output_num)])
 
-class CrowBaseSwitch(SwitchEntity):
-    _attr_has_entity_name = True 
+    entry.async_on_unload(async_dispatcher_connect(
+        hass, new_object_signal(entry.entry_id, KIND_OUTPUT), _async_add_output
+    ))
 
-    def __init__(self, controller, host):
-        self._controller = controller
-        self._host = host # FIX
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, "crow_alarm_panel")},
-            name="Crow Alarm System",
-            manufacturer="Crow/AAP",
-            model="IP Module",
-            configuration_url=f"http://{self._host}", # FIX
-        )
+class CrowBaseSwitch(CrowEntity, SwitchEntity):
+    """Basisklasse für alle Crow Switches."""
 
 
 class CrowOutput(CrowBaseSwitch):
-    def __init__(self, controller, host, output_number, output_name) -> None:
-        super().__init__(controller, host)
+    def __init__(self, data, output_number, output_name) -> None:
+        super().__init__(data)
         self._output_number = output_number
         self._attr_name = output_name
         self._attr_unique_id = f"crow_output_{output_number}"
@@ -81,9 +77,7 @@ class CrowOutput(CrowBaseSwitch):
              self._is_on = self._controller.output_state[self._output_number].get("status", {}).get("open", False)
 
     async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, SIGNAL_OUTPUT_UPDATE, self._update_callback)
-        )
+        self._async_subscribe(SIGNAL_OUTPUT_UPDATE, self._update_callback)
 
     @property
     def is_on(self) -> bool:
@@ -110,19 +104,73 @@ class CrowOutput(CrowBaseSwitch):
 
 
 class CrowRelay(CrowBaseSwitch):
-    def __init__(self, controller, host, relay_number) -> None:
-        super().__init__(controller, host)
+    """Relais als Impuls: an für pulse_length Sekunden, dann wieder aus.
+
+    Die Zentrale meldet Relais nicht zurück, der Zustand wird daher über den
+    gemeinsamen CrowDeadlineTimer geführt.
+    """
+
+    def __init__(self, data, relay_number, pulse_length, scheduler) -> None:
+        super().__init__(data)
         self._relay_number = relay_number
         self._attr_name = f"Relay {relay_number}"
         self._attr_unique_id = f"crow_relay_{relay_number}"
         self._attr_icon = "mdi:electric-switch"
+        self._pulse_length = pulse_length
+        self._scheduler = scheduler
+        self._relays = data.relays
+        self._cancel_pulse = None
+        self._queued = 0
+
+    async def async_added_to_hass(self) -> None:
+        # Ziel für den Dienst crowipmodule.pulse
+        self._relays[self.entity_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._relays.pop(self.entity_id, None)
+        self._queued = 0
+        if self._cancel_pulse:
+            self._cancel_pulse()
+            self._cancel_pulse = None
 
     @property
     def is_on(self) -> bool:
-        return False
+        return self._cancel_pulse is not None
+
+    @property
+    def extra_state_attributes(self):
+        return {"queued_pulses": self._queued}
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        self._controller.relay_on(self._relay_number)
-        
+        if not self.is_on:
+            await self.async_pulse()
+
     async def async_turn_off(self, **kwargs: Any) -> None:
-        pass
+        # Ein laufender Impuls lässt sich nicht abbrechen, nur die Warteschlange
+        self._queued = 0
+        self.async_write_ha_state()
+
+    async def async_pulse(self, count: int = 1) -> None:
+        """Queue pulses; they run back-to-back without blocking the loop."""
+        self._queued += count
+        if not self.is_on:
+            self._start_pulse()
+        else:
+            self.async_write_ha_state()
+
+    @callback
+    def _start_pulse(self) -> None:
+        self._queued -= 1
+        self._controller.relay_on(self._relay_number)
+        self._cancel_pulse = self._scheduler.async_call_later(
+            self._pulse_length, self._end_pulse
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _end_pulse(self) -> None:
+        self._cancel_pulse = None
+        if self._queued > 0:
+            self._start_pulse()
+        else:
+            self.async_write_ha_state()
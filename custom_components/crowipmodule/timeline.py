@@ -0,0 +1,133 @@
+"""In-memory timeline of Crow panel transitions."""
+from bisect import bisect_left, bisect_right
+import logging
+import threading
+import time
+
+from .const import (
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE,
+    SIGNAL_SYSTEM_UPDATE, SIGNAL_OUTPUT_UPDATE,
+    TIMELINE_MAX_EVENTS,
+)
+from .priority import area_number
+
+_LOGGER = logging.getLogger(__name__)
+
+# Signal -> (Art, Attribut des Controllers)
+TIMELINE_KINDS = {
+    SIGNAL_ZONE_UPDATE: ("zone", "zone_state"),
+    SIGNAL_AREA_UPDATE: ("area", "area_state"),
+    SIGNAL_OUTPUT_UPDATE: ("output", "output_state"),
+    SIGNAL_SYSTEM_UPDATE: ("system", None),
+}
+# Arten, deren Objekte eine Nummer haben (System hat keine)
+NUMBERED_KINDS = ("zone", "area", "output")
+
+
+class _Index:
+    """Events in time order with a parallel list of their timestamps."""
+
+    __slots__ = ("times", "events")
+
+    def __init__(self) -> None:
+        self.times = []
+        self.events = []
+
+    def append(self, event) -> None:
+        self.times.append(event["time"])
+        self.events.append(event)
+
+    def drop_before(self, cutoff) -> None:
+        count = bisect_left(self.times, cutoff)
+        if count:
+            del self.times[:count]
+            del self.events[:count]
+
+    def between(self, start, end):
+        lo = 0 if start is None else bisect_left(self.times, start)
+        hi = len(self.times) if end is None else bisect_right(self.times, end)
+        return self.events[lo:hi]
+
+
+class CrowTimeline:
+    """Bounded ring of zone, area, output and system transitions.
+
+    Recorded in the library thread from the same callbacks that feed the
+    dispatcher, so transitions coalesced by the event queue are still seen.
+    Only changed status attributes are stored. Queries use bisection on a
+    global index, on one index per kind and on one index per object.
+    """
+
+    def __init__(self, controller, max_events=TIMELINE_MAX_EVENTS) -> None:
+        self._controller = controller
+        self._max_events = max_events
+        self._lock = threading.Lock()
+        self._all = _Index()
+        self._kinds = {kind: _Index() for kind, _ in TIMELINE_KINDS.values()}
+        self._objects = {}
+        # Ausgangszustand der Lib, damit das erste Event nur Änderungen enthält
+        self._last = {("system", None): dict(controller.system_state.get("status", {}))}
+        for kind, attr in TIMELINE_KINDS.values():
+            if attr is not None:
+                for num, info in getattr(controller, attr).items():
+                    self._last[(kind, num)] = dict(info.get("status", {}))
+
+    def record(self, signal, data) -> None:
+        """Store the transitions behind an update. Called from the library thread."""
+        kind, attr = TIMELINE_KINDS[signal]
+        if attr is None:
+            changed = [(None, self._controller.system_state)]
+        else:
+            state = getattr(self._controller, attr)
+            if data is None:
+                changed = list(state.items())
+            else:
+                num = area_number(data) if signal == SIGNAL_AREA_UPDATE else int(data)
+                changed = [(num, state.get(num, {}))]
+
+        now = time.time()
+        with self._lock:
+            if self._all.times:
+                # Uhr darf nicht rückwärts laufen, sonst stimmt die Bisektion nicht
+                now = max(now, self._all.times[-1])
+            for num, info in changed:
+                status = dict(info.get("status", {}))
+                last = self._last.get((kind, num), {})
+                changes = {key: val for key, val in status.items() if last.get(key) != val}
+                if not changes:
+                    continue
+                self._last[(kind, num)] = status
+                event = {"time": now, "kind": kind, "number": num, "changes": changes}
+                self._all.append(event)
+                self._kinds[kind].append(event)
+                self._objects.setdefault((kind, num), _Index()).append(event)
+            self._trim()
+
+    def _trim(self) -> None:
+        # Mit 10% Spielraum kürzen, damit nicht jedes Event die Listen verschiebt
+        excess = len(self._all.times) - self._max_events
+        if excess <= self._max_events // 10:
+            return
+        cutoff = self._all.times[excess]
+        self._all.drop_before(cutoff)
+        for index in (*self._kinds.values(), *self._objects.values()):
+            index.drop_before(cutoff)
+
+    def query(self, start=None, end=None, kind=None, number=None, limit=None):
+        """Return events between start and end (epoch seconds), oldest first.
+
+        A number selects one object and needs a kind of NUMBERED_KINDS.
+        """
+        if number is not None and kind not in NUMBERED_KINDS:
+            raise ValueError(f"number {number} needs a kind of {NUMBERED_KINDS}, got {kind!r}")
+        with self._lock:
+            if number is not None:
+                index = self._objects.get((kind, number))
+            elif kind is not None:
+                index = self._kinds.get(kind)
+            else:
+                index = self._all
+            events = index.between(start, end) if index else []
+        if limit is not None:
+            events = events[-limit:]
+        return events
@@ -0,0 +1,90 @@
+"""Shared timer queue for relay pulses and supervision windows of all Crow panels."""
+import heapq
+from itertools import count
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_DEADLINE_TIMER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_deadline_timer(hass: HomeAssistant) -> "CrowDeadlineTimer":
+    """Return the timer shared by all config entries."""
+    if DATA_DEADLINE_TIMER not in hass.data:
+        hass.data[DATA_DEADLINE_TIMER] = CrowDeadlineTimer(hass)
+    return hass.data[DATA_DEADLINE_TIMER]
+
+
+class CrowDeadlineTimer:
+    """Deadline heap driven by a single loop timer.
+
+    Every scheduled call is one heap entry; the loop timer is always armed for
+    the earliest deadline only, so any number of relay pulses and supervised
+    zones costs one wakeup per deadline. Cancelled entries stay in the heap
+    and are skipped when due; once nothing live is left, the heap is cleared
+    and the timer cancelled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._heap = []
+        self._seq = count()
+        self._timer = None
+        self._live = 0
+
+    @callback
+    def async_call_later(self, delay, action):
+        """Run action after delay seconds. Return a function that cancels it."""
+        return self.async_call_at(self._hass.loop.time() + delay, action)
+
+    @callback
+    def async_call_at(self, when, action):
+        """Run action at loop time when. Return a function that cancels it."""
+        entry = [when, next(self._seq), action]
+        heapq.heappush(self._heap, entry)
+        self._live += 1
+        self._arm()
+
+        @callback
+        def _cancel() -> None:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._live -= 1
+            if not self._live:
+                self._heap.clear()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+        return _cancel
+
+    @callback
+    def _arm(self) -> None:
+        """Point the loop timer at the earliest deadline."""
+        if not self._heap:
+            return
+        deadline = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= deadline:
+                return
+            self._timer.cancel()
+        self._timer = self._hass.loop.call_at(deadline, self._fire)
+
+    @callback
+    def _fire(self) -> None:
+        self._timer = None
+        now = self._hass.loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            action, entry[2] = entry[2], None
+            if action is None:
+                continue
+            self._live -= 1
+            try:
+                action()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in Crow timer")
+        self._arm()
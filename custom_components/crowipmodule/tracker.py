@@ -0,0 +1,245 @@
+"""Tracking of zones and outputs reported by the Crow panel."""
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .priority import entry_signal
+from .const import (
+    DOMAIN, SIGNAL_ZONE_UPDATE, SIGNAL_OUTPUT_UPDATE, SIGNAL_NEW_OBJECT,
+    CONF_ZONES, CONF_OUTPUTS, CONF_RETIRE_AFTER, DEFAULT_RETIRE_AFTER,
+    TRACKER_SAVE_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+KIND_ZONE = "zone"
+KIND_OUTPUT = "output"
+
+# Art -> (Signal der Lib, Plattform, Unique-ID Schema)
+TRACKED_KINDS = {
+    KIND_ZONE: (SIGNAL_ZONE_UPDATE, Platform.BINARY_SENSOR, "crow_zone_{}"),
+    KIND_OUTPUT: (SIGNAL_OUTPUT_UPDATE, Platform.SWITCH, "crow_output_{}"),
+}
+# Art -> (Zustands-Dict des Controllers, Option mit konfigurierten Objekten)
+TRACKED_STATES = {
+    KIND_ZONE: ("zone_state", CONF_ZONES),
+    KIND_OUTPUT: ("output_state", CONF_OUTPUTS),
+}
+
+RETIRE_CHECK_INTERVAL = timedelta(hours=1)
+
+
+def new_object_signal(entry_id, kind) -> str:
+    """Dispatcher signal announcing a newly reported object of a kind."""
+    return f"{SIGNAL_NEW_OBJECT}_{entry_id}_{kind}"
+
+
+class CrowObjectTracker:
+    """Remember which zones and outputs the panel has reported, and when.
+
+    Objects configured in the options are always known. Any other object
+    counts as reported only when its status changes: the panel answers
+    every STATUS with a line for each zone, whether it exists or not.
+    Platforms create entities for the known objects on setup and for new
+    objects when new_object_signal() fires. Reported objects that did not
+    change for retire_after seconds are removed from the entity registry
+    (0 = never). Only time with a connection to the panel counts: the clock
+    starts at the first connect and is moved on by the length of every
+    outage. The real time of the last report is kept apart from that clock.
+    Both survive restarts in .storage.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id, controller, options) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._controller = controller
+        self._retire_after = options.get(CONF_RETIRE_AFTER, DEFAULT_RETIRE_AFTER) * 3600
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.objects")
+        self._configured = {
+            kind: {int(num) for num in options.get(option, {})}
+            for kind, (_, option) in TRACKED_STATES.items()
+        }
+        # Zuletzt gesehener Status je Objekt, Ausgangspunkt ist der Stand der Lib
+        self._status = {
+            kind: {
+                num: dict(info.get("status", {}))
+                for num, info in getattr(controller, attr, {}).items()
+            }
+            for kind, (attr, _) in TRACKED_STATES.items()
+        }
+        # Uhr für das Entfernen (um Ausfälle verschoben) und echte Meldezeit
+        self._seen = {kind: {} for kind in TRACKED_KINDS}
+        self._reported = {kind: {} for kind in TRACKED_KINDS}
+        self._listeners = {kind: [] for kind in TRACKED_KINDS}
+        self._unsubs = []
+        self._connected = False
+        self._clock_started = False
+        self._disconnected_at = None
+
+    async def async_load(self) -> None:
+        """Restore the last-seen times and start listening for reports."""
+        stored = await self._store.async_load()
+        if stored is None:
+            self._seed_from_registry()
+        else:
+            for kind, seen in self._seen.items():
+                seen.update((int(num), ts) for num, ts in stored.get(kind, {}).items())
+            for kind, reported in stored.get("last_report", {}).items():
+                self._reported[kind].update((int(num), ts) for num, ts in reported.items())
+
+        for kind, (signal, _, _) in TRACKED_KINDS.items():
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self._hass, entry_signal(signal, self._entry_id), self._listener(kind)
+                )
+            )
+        if self._retire_after:
+            self._unsubs.append(async_track_time_interval(
+                self._hass, self._async_check, RETIRE_CHECK_INTERVAL
+            ))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening and write the pending last-seen times."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self._hass.async_create_task(self._store.async_save(self._data()))
+
+    async def async_remove(self) -> None:
+        """Delete the stored data of a removed config entry."""
+        await self._store.async_remove()
+
+    def known(self, kind):
+        """Return the numbers of all configured or reported objects of a kind."""
+        return sorted(self._configured[kind] | set(self._seen[kind]))
+
+    @callback
+    def async_add_listener(self, kind, listener):
+        """Call listener(num) on every reported change of a kind. Return a remove function."""
+        self._listeners[kind].append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners[kind].remove(listener)
+        return _remove
+
+    @callback
+    def async_set_connected(self, connected) -> None:
+        """Pause the retirement clock while the panel is not connected."""
+        if connected == self._connected:
+            return
+        self._connected = connected
+        now = time.time()
+        if not connected:
+            self._disconnected_at = now
+            return
+
+        if not self._clock_started:
+            # Wie lange HA aus war, ist unbekannt: Uhr startet jetzt
+            self._clock_started = True
+            for seen in self._seen.values():
+                for num, ts in seen.items():
+                    seen[num] = max(ts, now)
+        elif self._disconnected_at is not None:
+            outage = now - self._disconnected_at
+            for seen in self._seen.values():
+                for num in seen:
+                    seen[num] += outage
+        self._disconnected_at = None
+        self._store.async_delay_save(self._data, TRACKER_SAVE_DELAY)
+
+    def last_seen(self, kind, num):
+        """Return when an object last reported a change (epoch seconds) or None."""
+        return self._reported[kind].get(num)
+
+    def _listener(self, kind):
+        state = getattr(self._controller, TRACKED_STATES[kind][0])
+
+        @callback
+        def _updated(num) -> None:
+            for number in state if num is None else (int(num),):
+                if self._changed(kind, number, state):
+                    self._report(kind, number)
+        return _updated
+
+    @callback
+    def _changed(self, kind, num, state) -> bool:
+        """Return True if the status of an object differs from the last one seen."""
+        status = dict(state.get(num, {}).get("status", {}))
+        if self._status[kind].get(num) == status:
+            return False
+        self._status[kind][num] = status
+        return True
+
+    @callback
+    def _report(self, kind, num) -> None:
+        seen = self._seen[kind]
+        is_new = num not in seen and num not in self._configured[kind]
+        seen[num] = self._reported[kind][num] = time.time()
+        self._store.async_delay_save(self._data, TRACKER_SAVE_DELAY)
+        if is_new:
+            _LOGGER.debug("Panel reported new %s %s", kind, num)
+            async_dispatcher_send(self._hass, new_object_signal(self._entry_id, kind), num)
+        for listener in list(self._listeners[kind]):
+            listener(num)
+
+    @callback
+    def _seed_from_registry(self) -> None:
+        """Treat all entities registered before tracking existed as just seen."""
+        now = time.time()
+        registry = er.async_get(self._hass)
+        for reg_entry in er.async_entries_for_config_entry(registry, self._entry_id):
+            for kind, (_, platform, unique_id) in TRACKED_KINDS.items():
+                prefix = unique_id.format("")
+                if reg_entry.domain == platform and reg_entry.unique_id.startswith(prefix):
+                    num = reg_entry.unique_id[len(prefix):]
+                    if num.isdigit():
+                        self._seen[kind][int(num)] = now
+
+    @callback
+    def _async_check(self, _now) -> None:
+        self._retire_expired()
+
+    @callback
+    def _retire_expired(self) -> None:
+        """Remove entities of objects the panel no longer reports."""
+        if not self._retire_after or not self._connected:
+            return
+        deadline = time.time() - self._retire_after
+        registry = er.async_get(self._hass)
+        for kind, seen in self._seen.items():
+            _, platform, unique_id = TRACKED_KINDS[kind]
+            for num in [num for num, ts in seen.items() if ts < deadline]:
+                del seen[num]
+                self._reported[kind].pop(num, None)
+                if num in self._configured[kind]:
+                    continue
+                entity_id = registry.async_get_entity_id(
+                    platform, DOMAIN, unique_id.format(num)
+                )
+                # Unique-IDs sind nicht je Eintrag: nur eigene Entities entfernen
+                reg_entry = registry.async_get(entity_id) if entity_id else None
+                if reg_entry and reg_entry.config_entry_id == self._entry_id:
+                    _LOGGER.info("Retiring %s, not reported by the panel", entity_id)
+                    registry.async_remove(entity_id)
+        self._store.async_delay_save(self._data, TRACKER_SAVE_DELAY)
+
+    def _data(self):
+        data = {
+            kind: {str(num): ts for num, ts in seen.items()}
+            for kind, seen in self._seen.items()
+        }
+        data["last_report"] = {
+            kind: {str(num): ts for num, ts in reported.items()}
+            for kind, reported in self._reported.items()
+        }
+        return data
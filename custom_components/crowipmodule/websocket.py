@@ -0,0 +1,59 @@
+"""Websocket API of the Crow IP Module integration."""
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .timeline import NUMBERED_KINDS
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_timeline)
+
+
+def _number_needs_kind(msg):
+    """A number only identifies an object together with its kind."""
+    if "number" in msg and msg.get("kind") not in NUMBERED_KINDS:
+        raise vol.Invalid(f"number requires kind {', '.join(NUMBERED_KINDS)}")
+    return msg
+
+
+@websocket_api.websocket_command(
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): f"{DOMAIN}/timeline",
+                vol.Required("entry_id"): str,
+                vol.Optional("start_time"): cv.datetime,
+                vol.Optional("end_time"): cv.datetime,
+                vol.Optional("kind"): vol.In([*NUMBERED_KINDS, "system"]),
+                vol.Optional("number"): vol.Coerce(int),
+                vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            }
+        ),
+        _number_needs_kind,
+    )
+)
+@callback
+def websocket_timeline(hass: HomeAssistant, connection, msg) -> None:
+    """Return panel transitions of one entry from the in-memory timeline."""
+    data = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if data is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Unknown entry")
+        return
+
+    start = msg.get("start_time")
+    end = msg.get("end_time")
+    events = data.timeline.query(
+        start=dt_util.as_timestamp(start) if start else None,
+        end=dt_util.as_timestamp(end) if end else None,
+        kind=msg.get("kind"),
+        number=msg.get("number"),
+        limit=msg.get("limit"),
+    )
+    connection.send_result(msg["id"], {"events": events})
@@ -0,0 +1 @@
+"""Tests for the Crow IP Module integration."""
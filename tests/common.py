@@ -0,0 +1,36 @@
+"""Helpers shared by the Crow IP Module tests and benchmarks."""
+import math
+
+
+def percentile(values, pct) -> float:
+    """Return the pct-th percentile (nearest rank) of values."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def report(title, rows) -> None:
+    """Print a benchmark table; visible with pytest -s."""
+    print(f"\n{title}")
+    for label, value in rows:
+        print(f"  {label:<40} {value}")
+
+
+def slope(values) -> float:
+    """Least-squares slope of values over their index."""
+    count = len(values)
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(count))
+    return num / den if den else 0.0
+
+
+def assert_no_upward_trend(name, values, allowed) -> None:
+    """Fail if the fitted growth of values over the run exceeds allowed."""
+    if len(values) < 3:
+        return
+    growth = slope(values) * (len(values) - 1)
+    assert growth <= allowed, (
+        f"{name} trends upward: +{growth:.4g} over {len(values)} samples (allowed {allowed:.4g})"
+    )
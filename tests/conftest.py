@@ -0,0 +1,81 @@
+"""Fixtures for the Crow IP Module tests."""
+import logging
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT
+
+from custom_components.crowipmodule.const import (
+    DOMAIN, CONF_KEEP_ALIVE, CONF_AREAS, CONF_ZONES, CONF_OUTPUTS,
+)
+
+from .simulator import CrowPanelSimulator
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--soak", action="store_true",
+        help="run the soak test at full size (millions of events, hundreds of cycles)",
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load custom_components/crowipmodule in every test."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def quiet_library():
+    # pycrowipmodule loggt jede Zeile auf DEBUG
+    logging.getLogger("pycrowipmodule").setLevel(logging.WARNING)
+
+
+@pytest.fixture
+async def panel(socket_enabled):
+    """A simulated IP Module listening on localhost."""
+    simulator = CrowPanelSimulator()
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+def zone_options(count, **extra):
+    """Options with count named zones."""
+    return {
+        str(num): {"name": f"Zone {num}", "type": "motion", **extra}
+        for num in range(1, count + 1)
+    }
+
+
+def create_entry(hass, panel, options=None, keep_alive=60, timeout=2) -> MockConfigEntry:
+    """Add a config entry pointing at a simulated panel."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Crow {panel.port}",
+        data={
+            CONF_HOST: panel.host,
+            CONF_PORT: panel.port,
+            CONF_KEEP_ALIVE: keep_alive,
+            CONF_TIMEOUT: timeout,
+        },
+        options={CONF_AREAS: {}, CONF_ZONES: {}, CONF_OUTPUTS: {}, **(options or {})},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def store_known_objects(hass_storage, entry, zones, outputs=()) -> None:
+    """Pre-populate the tracker store as if zones 1..zones and outputs had been reported."""
+    key = f"{DOMAIN}.{entry.entry_id}.objects"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "zone": {str(num): time.time() for num in range(1, zones + 1)},
+            "output": {str(num): time.time() for num in outputs},
+        },
+    }
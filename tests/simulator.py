@@ -0,0 +1,101 @@
+"""Simulated Crow/AAP IP Module for tests and benchmarks.
+
+Speaks the line protocol of the real module closely enough for
+pycrowipmodule: it answers STATUS with the state of all zones, areas and
+the system, and can push events, drop connections or go silent.
+"""
+import asyncio
+
+# Zonen jenseits von 16 kennt die Lib nicht (KeyError im Handler)
+LIBRARY_MAX_ZONES = 16
+
+
+def _send(writer, lines) -> None:
+    writer.write("".join(f"{line}\r\n" for line in lines).encode("ascii"))
+
+
+class CrowPanelSimulator:
+    """Local TCP server impersonating one IP Module."""
+
+    def __init__(self, zones=LIBRARY_MAX_ZONES) -> None:
+        self.zones = min(zones, LIBRARY_MAX_ZONES)
+        self.open_zones = set()
+        self.silent = False
+        self.commands = []
+        self.connects = []
+        self.max_clients = 0
+        self._writers = set()
+        self._server = None
+        self._closed = asyncio.Event()
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1"
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def clients(self) -> int:
+        return len(self._writers)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, 0)
+
+    async def stop(self) -> None:
+        self._closed.set()
+        self.drop()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def status_lines(self):
+        """Lines the module sends in reply to STATUS."""
+        lines = [
+            f"ZO{num}" if num in self.open_zones else f"ZC{num}"
+            for num in range(1, self.zones + 1)
+        ]
+        return [*lines, "DA", "DB", "MR", "BR", "TR", "LR", "DR", "RO"]
+
+    def push(self, *lines) -> None:
+        """Send lines to every connected client."""
+        for writer in self._writers:
+            _send(writer, lines)
+
+    async def drain(self) -> None:
+        """Wait until every client accepted what was pushed."""
+        for writer in list(self._writers):
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    def drop(self) -> None:
+        """Close all client connections, as a module reboot would."""
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader, writer) -> None:
+        loop = asyncio.get_running_loop()
+        self._writers.add(writer)
+        self.connects.append(loop.time())
+        self.max_clients = max(self.max_clients, len(self._writers))
+        try:
+            while not self._closed.is_set():
+                if self.silent:
+                    # Nichts mehr lesen: der Sendepuffer des Clients läuft voll
+                    await self._closed.wait()
+                    break
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("ascii", "replace").strip()
+                self.commands.append((loop.time(), command))
+                if command == "STATUS" and not self.silent:
+                    _send(writer, self.status_lines())
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -0,0 +1,51 @@
+"""Setup wizard and module discovery."""
+import asyncio
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.crowipmodule.const import (
+    DOMAIN, DISCOVERY_CONCURRENCY, DISCOVERY_CONNECT_TIMEOUT,
+)
+from custom_components.crowipmodule.discovery import async_discover
+
+# Letzte Adresse des Netzes: wird nur mit einer einzigen Probe-Welle erreicht
+LAST_HOST = "192.0.2.254"
+
+
+async def test_discovery_is_optional(hass: HomeAssistant) -> None:
+    """Manual entry skips the network search."""
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    for step in ("areas", "outputs", "zones"):
+        assert result["step_id"] == step
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.MENU
+    assert result["menu_options"] == ["discovery", "connection"]
+
+    with patch("custom_components.crowipmodule.config_flow.async_discover") as discover:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"next_step_id": "connection"}
+        )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "connection"
+    discover.assert_not_called()
+    hass.config_entries.flow.async_abort(result["flow_id"])
+
+
+async def test_discovery_probes_whole_subnet(hass: HomeAssistant) -> None:
+    """Every host of a /24 is probed within the budget, a limited number at a time."""
+    in_flight = [0, 0]
+
+    async def _silent_host(host, port, connect_timeout):
+        # Antwortet nicht: kostet die volle Connect-Wartezeit
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(connect_timeout)
+        in_flight[0] -= 1
+        return host == LAST_HOST
+
+    with patch("custom_components.crowipmodule.discovery.async_probe", _silent_host):
+        assert await async_discover("192.0.2.1/24", 5002) == [LAST_HOST]
+    assert in_flight[1] == DISCOVERY_CONCURRENCY
@@ -0,0 +1,63 @@
+"""Bounded teardown of the library connection."""
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.crowipmodule.const import DOMAIN, STOP_TIMEOUT
+
+from .common import report
+from .conftest import create_entry
+
+# Mehr als Kernel-Puffer beider Seiten aufnehmen, der Rest bleibt im Transport
+FILL_WRITES = 32
+FILL_WRITE_SIZE = 1024 * 1024
+
+
+async def _wait(hass, predicate, what) -> None:
+    for _ in range(500):
+        if predicate():
+            return
+        await hass.async_add_executor_job(time.sleep, 0.01)
+    raise AssertionError(f"timed out waiting for {what}")
+
+
+async def test_stop_silent_panel_full_buffer(hass: HomeAssistant, panel) -> None:
+    """async_stop returns within STOP_TIMEOUT although the panel stopped reading."""
+    entry = create_entry(hass, panel)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    data = hass.data[DOMAIN][entry.entry_id]
+    connection = data.connection
+    await _wait(hass, lambda: connection._connected, "connect")  # pylint: disable=protected-access
+
+    # Die Teardown- und Backoff-Logik greift auf diese Interna der Lib zu
+    client = data.controller._client  # pylint: disable=protected-access
+    assert client is not None
+    assert client._eventLoop.is_running()  # pylint: disable=protected-access
+    assert client._transport is not None  # pylint: disable=protected-access
+    assert client._shutdown is False  # pylint: disable=protected-access
+    assert client.reconnect == connection._reconnect  # pylint: disable=protected-access
+
+    # Ein kurzer Befehl noch, danach liest das Modul nichts mehr
+    panel.silent = True
+    client._eventLoop.call_soon_threadsafe(client.send_data, "KEYS 1")  # pylint: disable=protected-access
+    await _wait(hass, lambda: any(cmd == "KEYS 1" for _, cmd in panel.commands), "last command")
+    for _ in range(FILL_WRITES):
+        client._eventLoop.call_soon_threadsafe(client.send_data, "KEYS " + "1" * FILL_WRITE_SIZE)  # pylint: disable=protected-access
+    transport = client._transport  # pylint: disable=protected-access
+    await _wait(hass, lambda: transport.get_write_buffer_size() > 0, "full write buffer")
+
+    started = time.monotonic()
+    await connection.async_stop()
+    elapsed = time.monotonic() - started
+    report("Teardown with silent panel and full write buffer", [
+        ("written to the silent panel", f"{FILL_WRITES * FILL_WRITE_SIZE / 1e6:.0f} MB"),
+        ("async_stop", f"{elapsed:.2f} s (limit {STOP_TIMEOUT:.0f} s)"),
+    ])
+    assert elapsed < STOP_TIMEOUT
+    assert connection._runner.done()  # pylint: disable=protected-access
+    assert transport.is_closing()
+    assert client._shutdown is True  # pylint: disable=protected-access
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,163 @@
+"""MQTT state export."""
+from datetime import timedelta
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from custom_components.crowipmodule.const import (
+    CONF_MQTT_EXPORT, EXPORT_BATCH_WINDOW,
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, SIGNAL_OUTPUT_UPDATE, SIGNAL_SYSTEM_UPDATE,
+)
+from custom_components.crowipmodule.export import CrowMqttExporter
+from custom_components.crowipmodule.priority import entry_signal
+
+from .conftest import create_entry
+
+ENTRY_ID = "export"
+PREFIX = "crow"
+
+
+class _Panel:
+    """State dicts in the layout of pycrowipmodule.CrowIPAlarmPanel."""
+
+    def __init__(self) -> None:
+        self.zone_state = {n: {"status": {"open": False}} for n in (1, 2, 3)}
+        self.area_state = {n: {"status": {"armed": False}} for n in (1, 2)}
+        self.output_state = {n: {"status": {"open": False}} for n in (1, 2)}
+        self.system_state = {"status": {"mains": True}}
+
+
+@pytest.fixture
+async def exporter(hass: HomeAssistant):
+    """A started exporter with a mocked MQTT client; yields (panel, publish, set_connected)."""
+    panel = _Panel()
+    publish = AsyncMock()
+    listeners = []
+
+    def _subscribe(_hass, listener):
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    with (
+        patch("homeassistant.components.mqtt.async_wait_for_mqtt_client", AsyncMock(return_value=True)),
+        patch("homeassistant.components.mqtt.async_subscribe_connection_status", _subscribe),
+        patch("homeassistant.components.mqtt.is_connected", return_value=False),
+        patch("homeassistant.components.mqtt.async_publish", publish),
+    ):
+        export = CrowMqttExporter(hass, ENTRY_ID, panel, PREFIX)
+        assert await export.async_start()
+
+        def _set_connected(connected):
+            for listener in list(listeners):
+                listener(connected)
+
+        yield panel, publish, _set_connected
+        export.async_stop()
+
+
+def _send(hass, signal, data) -> None:
+    async_dispatcher_send(hass, entry_signal(signal, ENTRY_ID), data)
+
+
+async def _window(hass) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=EXPORT_BATCH_WINDOW + 0.1))
+    await hass.async_block_till_done()
+
+
+def _published(publish):
+    return {call.args[1]: json.loads(call.args[2]) for call in publish.await_args_list}
+
+
+async def test_setup_does_not_wait_for_mqtt(hass: HomeAssistant, panel) -> None:
+    """MQTT still starting must not hold up the entry setup."""
+    MockConfigEntry(domain="mqtt").add_to_hass(hass)
+    entry = create_entry(hass, panel, {CONF_MQTT_EXPORT: True})
+
+    started = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert time.perf_counter() - started < 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_changes_are_batched(hass: HomeAssistant, exporter) -> None:
+    """Updates within one window are published together, once per topic."""
+    panel, publish, _ = exporter
+    panel.zone_state[1]["status"]["open"] = True
+    _send(hass, SIGNAL_ZONE_UPDATE, "1")
+    _send(hass, SIGNAL_ZONE_UPDATE, "1")
+    _send(hass, SIGNAL_AREA_UPDATE, "A")
+    _send(hass, SIGNAL_SYSTEM_UPDATE, None)
+    await hass.async_block_till_done()
+    publish.assert_not_awaited()
+
+    await _window(hass)
+    assert publish.await_count == 3
+    assert _published(publish) == {
+        f"{PREFIX}/zone/1": {"open": True},
+        f"{PREFIX}/area/1": {"armed": False},
+        f"{PREFIX}/system": {"mains": True},
+    }
+    assert all(call.kwargs["retain"] for call in publish.await_args_list)
+
+
+async def test_only_changes_are_published(hass: HomeAssistant, exporter) -> None:
+    """A topic is published again only when its payload changed."""
+    panel, publish, _ = exporter
+    _send(hass, SIGNAL_OUTPUT_UPDATE, None)
+    await _window(hass)
+    assert set(_published(publish)) == {f"{PREFIX}/output/1", f"{PREFIX}/output/2"}
+
+    publish.reset_mock()
+    panel.output_state[2]["status"]["open"] = True
+    _send(hass, SIGNAL_OUTPUT_UPDATE, None)
+    await _window(hass)
+    assert _published(publish) == {f"{PREFIX}/output/2": {"open": True}}
+
+
+async def test_failed_publish_is_retried_after_reconnect(hass: HomeAssistant, exporter) -> None:
+    """Topics of a batch that hit a disconnected broker are sent once it is back."""
+    panel, publish, set_connected = exporter
+    publish.side_effect = HomeAssistantError("not connected")
+    panel.zone_state[2]["status"]["open"] = True
+    for num in ("1", "2", "3"):
+        _send(hass, SIGNAL_ZONE_UPDATE, num)
+    await _window(hass)
+    assert publish.await_count == 1
+
+    publish.reset_mock()
+    publish.side_effect = None
+    set_connected(True)
+    await hass.async_block_till_done()
+    await _window(hass)
+    published = _published(publish)
+    assert {f"{PREFIX}/zone/{num}" for num in (1, 2, 3)} <= set(published)
+    assert published[f"{PREFIX}/zone/2"] == {"open": True}
+
+
+async def test_snapshot_on_reconnect(hass: HomeAssistant, exporter) -> None:
+    """Every (re)connect of the MQTT client publishes one retained snapshot."""
+    panel, publish, set_connected = exporter
+    panel.zone_state[3]["status"]["open"] = True
+    for _ in range(2):
+        publish.reset_mock()
+        set_connected(False)
+        set_connected(True)
+        await hass.async_block_till_done()
+        publish.assert_awaited_once()
+        assert publish.await_args.kwargs["retain"]
+        assert _published(publish) == {f"{PREFIX}/snapshot": {
+            "system": {"mains": True},
+            "zone": {"1": {"open": False}, "2": {"open": False}, "3": {"open": True}},
+            "area": {"1": {"armed": False}, "2": {"armed": False}},
+            "output": {"1": {"open": False}, "2": {"open": False}},
+        }}
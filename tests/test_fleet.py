@@ -0,0 +1,152 @@
+"""Fleet benchmark: 50 simulated panels through startup, keepalives and a reconnect storm."""
+import asyncio
+import math
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.crowipmodule.const import DOMAIN, ADMISSION_CONCURRENCY
+
+from .common import report
+from .conftest import create_entry
+from .simulator import CrowPanelSimulator
+
+PANELS = 50
+KEEP_ALIVE = 4
+WINDOW = 0.25
+KEEPALIVE_ROUNDS = 2
+
+
+@pytest.fixture
+async def fleet(socket_enabled):
+    """PANELS simulated IP Modules."""
+    simulators = [CrowPanelSimulator() for _ in range(PANELS)]
+    for simulator in simulators:
+        await simulator.start()
+    yield simulators
+    for simulator in simulators:
+        await simulator.stop()
+
+
+class _CpuProbe:
+    """Process CPU time (all threads) per WINDOW."""
+
+    def __init__(self, hass) -> None:
+        self._hass = hass
+        self.samples = []
+        self._task = None
+
+    def start(self) -> None:
+        self._task = self._hass.async_create_background_task(self._run(), "cpu probe")
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        await asyncio.wait([self._task])
+
+    def between(self, start, end):
+        return [cpu for at, cpu in self.samples if start <= at <= end]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last = time.process_time()
+        while True:
+            await asyncio.sleep(WINDOW)
+            now = time.process_time()
+            self.samples.append((loop.time(), (now - last) / WINDOW))
+            last = now
+
+
+def _per_window(times, start, end):
+    """Number of timestamps in each WINDOW between start and end."""
+    counts = [0] * max(math.ceil((end - start) / WINDOW), 1)
+    for at in times:
+        if start <= at < end:
+            counts[int((at - start) / WINDOW)] += 1
+    return counts
+
+
+async def _wait_all_connected(hass, fleet, entries) -> None:
+    connections = [hass.data[DOMAIN][entry.entry_id].connection for entry in entries]
+    deadline = time.monotonic() + 120
+    while not all(
+        conn._connected and panel.clients == 1  # pylint: disable=protected-access
+        for conn, panel in zip(connections, fleet)
+    ):
+        assert time.monotonic() < deadline, "fleet did not connect"
+        await asyncio.sleep(0.05)
+
+
+def _cpu(samples) -> str:
+    return f"{max(samples, default=0) * 100:.0f} % / {sum(samples) / max(len(samples), 1) * 100:.0f} %"
+
+
+def _profile(name, connects, statuses, cpu):
+    return [
+        (f"{name}: peak connects / {WINDOW} s", max(connects)),
+        (f"{name}: peak STATUS / {WINDOW} s", max(statuses)),
+        (f"{name}: peak / mean CPU", _cpu(cpu)),
+    ]
+
+
+@pytest.mark.benchmark
+async def test_fleet_profile(hass: HomeAssistant, fleet) -> None:
+    """Connects stay within the admission limit and keepalives are spread over the interval."""
+    entries = [create_entry(hass, panel, keep_alive=KEEP_ALIVE, timeout=1) for panel in fleet]
+    loop = hass.loop
+    probe = _CpuProbe(hass)
+    probe.start()
+    rows = []
+    try:
+        # 1. Start: alle Einträge zugleich, wie nach einem HA-Neustart
+        started = loop.time()
+        assert await hass.config_entries.async_setup(entries[0].entry_id)
+        await _wait_all_connected(hass, fleet, entries)
+        connected = loop.time()
+        startup_connects = _per_window([at for panel in fleet for at in panel.connects], started, connected)
+        rows.append(("startup: all panels connected", f"{connected - started:.1f} s"))
+
+        # 2. Keepalives im eingeschwungenen Zustand
+        await asyncio.sleep(KEEPALIVE_ROUNDS * KEEP_ALIVE)
+        steady = loop.time()
+        keepalives = [
+            at for panel in fleet for at, cmd in panel.commands if cmd == "STATUS" and at >= connected
+        ]
+        keepalive_counts = _per_window(keepalives, connected, steady)
+        ideal = PANELS * WINDOW / KEEP_ALIVE
+
+        # 3. Netzausfall: alle Verbindungen brechen gleichzeitig ab
+        for panel in fleet:
+            panel.drop()
+        dropped = loop.time()
+        await _wait_all_connected(hass, fleet, entries)
+        recovered = loop.time()
+        storm_connects = _per_window([at for panel in fleet for at in panel.connects], dropped, recovered)
+        storm_statuses = _per_window(
+            [at for panel in fleet for at, cmd in panel.commands if cmd == "STATUS"], dropped, recovered
+        )
+        rows.append(("reconnect storm: all panels back", f"{recovered - dropped:.1f} s"))
+    finally:
+        await probe.stop()
+
+    startup_statuses = _per_window(
+        [at for panel in fleet for at, cmd in panel.commands if cmd == "STATUS"], started, connected
+    )
+    report(f"Fleet of {PANELS} panels (keepalive {KEEP_ALIVE} s, admission {ADMISSION_CONCURRENCY})", [
+        *rows,
+        *_profile("startup", startup_connects, startup_statuses, probe.between(started, connected)),
+        (f"keepalive: STATUS / {WINDOW} s peak / ideal", f"{max(keepalive_counts)} / {ideal:.1f}"),
+        ("keepalive: peak / mean CPU", _cpu(probe.between(connected, steady))),
+        *_profile("reconnect storm", storm_connects, storm_statuses, probe.between(dropped, recovered)),
+    ])
+
+    # Admission: nie mehr neue Verbindungen pro Fenster, als Slots frei sind
+    assert max(startup_connects) <= ADMISSION_CONCURRENCY
+    assert max(storm_connects) <= ADMISSION_CONCURRENCY
+    # Phasen i/N: pro Fenster höchstens doppelt so viele Keepalives wie im Mittel
+    assert max(keepalive_counts) <= 2 * math.ceil(ideal)
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
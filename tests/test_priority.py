@@ -0,0 +1,209 @@
+"""Strict-priority delivery under a saturated zone storm."""
+from collections import deque
+import threading
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+
+from custom_components.crowipmodule.const import (
+    CONF_ZONES, CONF_OBJ_MAINS, CONF_OBJ_TAMPER,
+    SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, SIGNAL_SYSTEM_UPDATE,
+)
+from custom_components.crowipmodule.priority import CrowEventQueue, entry_signal
+
+from .common import percentile, report
+
+ENTRY_ID = "bench"
+ZONES = 16
+SMOKE_ZONE = 16
+GAS_ZONE = 15
+CO_ZONE = 14
+ALARMS = 200
+ALARM_INTERVAL = 0.005
+# Doppelt so viele Zonen-Updates, wie der Loop wegschreiben kann
+STORM_RATE = 10000
+P99_BOUND = 0.05
+# Kosten eines Entity-Writes auf einem schwachen Host (Recorder, Websocket-Abos)
+ENTITY_WRITE_COST = 0.0002
+
+
+class _Panel:
+    """State dicts in the layout of pycrowipmodule.CrowIPAlarmPanel."""
+
+    def __init__(self) -> None:
+        self.zone_state = {n: {"status": {"open": False}} for n in range(1, ZONES + 1)}
+        self.area_state = {n: {"status": {"alarm": False}} for n in (1, 2)}
+        self.system_state = {"status": {CONF_OBJ_TAMPER: True, CONF_OBJ_MAINS: True}}
+
+
+def _subscribe_zone_entities(hass, panel, written, unsubs):
+    """One listener per zone doing what CrowZoneSensor does on an update."""
+    for num in range(1, ZONES + 1):
+
+        @callback
+        def _update(zone, num=num):
+            if zone is None or int(zone) == num:
+                hass.states.async_set(
+                    f"binary_sensor.zone_{num}",
+                    "on" if panel.zone_state[num]["status"]["open"] else "off",
+                    panel.zone_state[num]["status"],
+                )
+                written[0] += 1
+                busy_until = time.perf_counter() + ENTITY_WRITE_COST
+                while time.perf_counter() < busy_until:
+                    pass
+
+        unsubs.append(async_dispatcher_connect(
+            hass, entry_signal(SIGNAL_ZONE_UPDATE, ENTRY_ID), _update
+        ))
+
+
+async def _run_storm(hass: HomeAssistant, deliver) -> dict:
+    """Flood zone updates from a thread and time interleaved area alarms."""
+    panel = _Panel()
+    written = [0]
+    latencies = []
+    sent = {"1": deque(), "2": deque()}
+    unsubs = []
+    _subscribe_zone_entities(hass, panel, written, unsubs)
+
+    @callback
+    def _area_update(area):
+        latencies.append(time.perf_counter() - sent[area].popleft())
+
+    unsubs.append(async_dispatcher_connect(
+        hass, entry_signal(SIGNAL_AREA_UPDATE, ENTRY_ID), _area_update
+    ))
+    stop = threading.Event()
+    submitted = [0]
+
+    def _storm():
+        # Wie der Lib-Thread: Zustand setzen, dann Callback
+        started = time.perf_counter()
+        while not stop.is_set():
+            due = int((time.perf_counter() - started) * STORM_RATE)
+            while submitted[0] < due:
+                # Nur Routine-Zonen; die Brandmeldezone ist ein eigener Test
+                num = submitted[0] % (ZONES - 1) + 1
+                status = panel.zone_state[num]["status"]
+                status["open"] = not status["open"]
+                deliver(panel, SIGNAL_ZONE_UPDATE, str(num))
+                submitted[0] += 1
+            time.sleep(0.001)
+
+    def _alarms():
+        for i in range(ALARMS):
+            area = "1" if i % 2 else "2"
+            status = panel.area_state[int(area)]["status"]
+            status["alarm"] = not status["alarm"]
+            sent[area].append(time.perf_counter())
+            deliver(panel, SIGNAL_AREA_UPDATE, area)
+            time.sleep(ALARM_INTERVAL)
+        stop.set()
+
+    storm = threading.Thread(target=_storm)
+    storm.start()
+    try:
+        await hass.async_add_executor_job(_alarms)
+    finally:
+        stop.set()
+        await hass.async_add_executor_job(storm.join)
+    await hass.async_block_till_done()
+    while unsubs:
+        unsubs.pop()()
+    return {
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies),
+        "delivered": len(latencies),
+        "submitted": submitted[0],
+        "written": written[0],
+    }
+
+
+@pytest.mark.benchmark
+async def test_alarm_latency_under_zone_storm(hass: HomeAssistant) -> None:
+    """Area alarms overtake a zone storm; p99 stays bounded."""
+    queues = {}
+
+    def _queued(panel, signal, data):
+        if "queue" not in queues:
+            queues["queue"] = CrowEventQueue(
+                hass, ENTRY_ID, panel, {CONF_ZONES: {str(SMOKE_ZONE): {"type": "smoke"}}}
+            )
+        queues["queue"].submit(signal, data)
+
+    def _unprioritised(panel, signal, data):
+        # Verhalten vor CrowEventQueue: ein call_soon_threadsafe pro Update
+        hass.loop.call_soon_threadsafe(
+            async_dispatcher_send, hass, entry_signal(signal, ENTRY_ID), data
+        )
+
+    result = await _run_storm(hass, _queued)
+    queues.pop("queue").close()
+    baseline = await _run_storm(hass, _unprioritised)
+
+    report("Area alarm delivery under a saturated zone storm", [
+        (f"{name} {key}", f"{stats[key] * 1000:.2f} ms" if key in ("p50", "p99", "max") else stats[key])
+        for name, stats in (("CrowEventQueue", result), ("unprioritised", baseline))
+        for key in ("p50", "p99", "max", "delivered", "submitted", "written")
+    ])
+
+    assert result["delivered"] == ALARMS
+    assert result["p99"] < P99_BOUND
+
+
+def _set_status(panel, key, value):
+    panel.system_state["status"][key] = value
+
+
+@pytest.mark.parametrize(
+    ("change", "signal", "data"),
+    [
+        (lambda panel: _set_status(panel, CONF_OBJ_TAMPER, False), SIGNAL_SYSTEM_UPDATE, None),
+        (lambda panel: _set_status(panel, CONF_OBJ_MAINS, False), SIGNAL_SYSTEM_UPDATE, None),
+        (lambda panel: None, SIGNAL_ZONE_UPDATE, str(SMOKE_ZONE)),
+        (lambda panel: None, SIGNAL_ZONE_UPDATE, str(GAS_ZONE)),
+        (lambda panel: None, SIGNAL_ZONE_UPDATE, str(CO_ZONE)),
+    ],
+    ids=["system tamper", "mains loss", "smoke zone", "gas zone", "co zone"],
+)
+async def test_urgent_overtakes_full_routine_lane(hass: HomeAssistant, change, signal, data) -> None:
+    """System tamper, mains loss and smoke/gas/co zones are delivered before queued routine updates."""
+    panel = _Panel()
+    queue = CrowEventQueue(hass, ENTRY_ID, panel, {CONF_ZONES: {
+        str(SMOKE_ZONE): {"type": "smoke"},
+        str(GAS_ZONE): {"type": "gas"},
+        str(CO_ZONE): {"type": "co"},
+    }})
+    delivered = []
+    unsubs = [
+        async_dispatcher_connect(
+            hass, entry_signal(sig, ENTRY_ID), lambda value, sig=sig: delivered.append((sig, value))
+        )
+        for sig in (SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE, SIGNAL_SYSTEM_UPDATE)
+    ]
+    # Der erste System-Report legt den Ausgangszustand der Flags fest
+    queue.submit(SIGNAL_SYSTEM_UPDATE, None)
+    await hass.async_block_till_done()
+    delivered.clear()
+
+    # Routine-Spur wie nach einem STATUS-Resync: alle übrigen Zonen, beide
+    # Bereiche und ein unveränderter System-Report
+    routine = [(SIGNAL_ZONE_UPDATE, str(num)) for num in range(1, CO_ZONE)]
+    routine += [(SIGNAL_AREA_UPDATE, str(num)) for num in (1, 2)]
+    routine.append((SIGNAL_SYSTEM_UPDATE, None))
+    for item in routine:
+        queue.submit(*item)
+    change(panel)
+    queue.submit(signal, data)
+    await hass.async_block_till_done()
+    queue.close()
+    while unsubs:
+        unsubs.pop()()
+
+    assert delivered[0] == (signal, data)
+    assert sorted(delivered[1:], key=repr) == sorted(routine, key=repr)
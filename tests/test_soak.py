@@ -0,0 +1,230 @@
+"""Soak test: event floods, reloads and reconnects against a simulated panel.
+
+The default run is short enough for the normal suite. With --soak it pushes
+millions of events through hundreds of reload/reconnect cycles. After every
+cycle it samples traced memory, thread count, event-loop lag, entity states,
+dispatcher connections and free admission slots. The test fails if any of them
+trends upward (or, for slots, downward).
+"""
+import asyncio
+import gc
+import logging
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import DATA_DISPATCHER
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
+from homeassistant.helpers.storage import Store
+
+from custom_components.crowipmodule.const import DOMAIN, DATA_FLEET_SCHEDULER, ADMISSION_CONCURRENCY
+
+from .common import assert_no_upward_trend, percentile, report
+from .conftest import create_entry
+
+QUICK = {"events": 2_000, "cycles": 14}
+SOAK = {"events": 10_000, "cycles": 300}
+# Caches von HA und Lib füllen sich in den ersten Zyklen
+WARMUP_CYCLES = 6
+MEMORY_GROWTH_BUDGET = 256 * 1024
+LAG_GROWTH_BUDGET = 0.05
+LINES_PER_WRITE = 500
+LAG_PROBE_INTERVAL = 0.01
+TRACE_FRAMES = 8
+SENTINEL_OUTPUT = 8
+
+# Ein Durchlauf aller Meldungsarten, die die Integration verarbeitet
+EVENT_MIX = [
+    *(f"ZO{num}" for num in range(1, 17)),
+    "AA", "EAA", "DA", "SB", "DB",
+    *(f"ZC{num}" for num in range(1, 17)),
+    "MF", "MR", "TF", "TR", "BF", "BR",
+    *(f"OO{num}" for num in range(1, 5)),
+    *(f"OC{num}" for num in range(1, 5)),
+    "ZA3", "ZR3", "ZBY4", "ZBYR4",
+]
+
+
+def _traced_memory() -> int:
+    # Log-Puffer (caplog, Capture von basicConfig der Lib) wachsen mit jeder Zeile
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, logging.__file__, all_frames=True)]
+    )
+    return sum(trace.size for trace in snapshot.traces)
+
+
+def _dispatcher_connections(hass) -> int:
+    return sum(len(targets) for targets in hass.data.get(DATA_DISPATCHER, {}).values())
+
+
+def _forget_outside_integration(hass, request, caplog, panel) -> None:
+    """Drop what the test harness and HA core keep per reload.
+
+    caplog and pytest's report handler keep every log record of the test,
+    among them asyncio's slow-callback warnings for gc.collect() and the
+    snapshot. The simulator records every command and connect. hass_storage
+    patches Store with autospec mocks whose call_args_list keeps every
+    written payload. EntityComponent.async_unload_entry only resets the
+    platform, so HA core keeps one empty EntityPlatform per domain and
+    reload in DATA_ENTITY_PLATFORM. None of this is held by the integration.
+    """
+    caplog.clear()
+    request.config.pluginmanager.get_plugin("logging-plugin").report_handler.reset()
+    panel.commands.clear()
+    panel.connects.clear()
+    for name in ("_async_load", "_async_write_data", "async_remove"):
+        getattr(Store, name).reset_mock()
+    platforms = hass.data.get(DATA_ENTITY_PLATFORM, {}).get(DOMAIN, [])
+    platforms[:] = [platform for platform in platforms if platform.entities]
+
+
+def _controller(hass, entry):
+    return hass.data[DOMAIN][entry.entry_id].controller
+
+
+class _LagProbe:
+    """Measure how late the event loop runs a short sleep."""
+
+    def __init__(self, hass) -> None:
+        self._hass = hass
+        self.samples = []
+        self._task = None
+
+    def start(self) -> None:
+        self._task = self._hass.async_create_background_task(self._run(), "lag probe")
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        await asyncio.wait([self._task])
+
+    def take(self):
+        samples, self.samples = self.samples, []
+        return samples
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            self.samples.append(loop.time() - started - LAG_PROBE_INTERVAL)
+
+
+async def _wait_for(hass, predicate, timeout, what) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError(f"timed out waiting for {what}")
+        await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+
+
+async def _flood(hass, panel, entry, events, marker_open) -> None:
+    """Push events and wait until the library and the loop processed them."""
+    lines = (EVENT_MIX * (events // len(EVENT_MIX) + 1))[:events]
+    for start in range(0, len(lines), LINES_PER_WRITE):
+        panel.push(*lines[start:start + LINES_PER_WRITE])
+        await panel.drain()
+
+    # Marker am Ende: Zeilen können an TCP-Grenzen zerschnitten werden, daher
+    # einzeln und notfalls wiederholt senden
+    marker = f"OO{SENTINEL_OUTPUT}" if marker_open else f"OC{SENTINEL_OUTPUT}"
+    status = _controller(hass, entry).output_state[SENTINEL_OUTPUT]["status"]
+    deadline = time.monotonic() + 120
+    while status["open"] != marker_open:
+        assert time.monotonic() < deadline, "panel events were not processed"
+        await asyncio.sleep(0.05)
+        panel.push(marker)
+    await hass.async_block_till_done()
+
+
+async def _reconnect(hass, panel, entry) -> None:
+    connection = hass.data[DOMAIN][entry.entry_id].connection
+    # Mit vollem Jitter kann der Reconnect schneller sein als ein Polling-Intervall
+    changes = []
+    remove = connection.async_add_listener(changes.append)
+    try:
+        panel.drop()
+        await _wait_for(
+            hass, lambda: False in changes and connection._connected and panel.clients == 1,  # pylint: disable=protected-access
+            30, "reconnect",
+        )
+    finally:
+        remove()
+
+
+async def _reload(hass, panel, entry) -> None:
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    connection = hass.data[DOMAIN][entry.entry_id].connection
+    await _wait_for(
+        hass, lambda: connection._connected and panel.clients == 1, 30, "connect after reload"  # pylint: disable=protected-access
+    )
+
+
+@pytest.mark.benchmark
+async def test_soak(hass: HomeAssistant, panel, request, caplog) -> None:
+    """No upward trend in memory, threads, loop lag, entities, connections or slots."""
+    size = SOAK if request.config.getoption("--soak") else QUICK
+    # basicConfig der Lib stellt Root auf DEBUG, und sie loggt jeden Alarm als ERROR
+    caplog.set_level(logging.WARNING)
+    logging.getLogger("pycrowipmodule").setLevel(logging.CRITICAL)
+    entry = create_entry(hass, panel, timeout=1)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await _reload(hass, panel, entry)
+
+    tracemalloc.start(TRACE_FRAMES)
+    probe = _LagProbe(hass)
+    probe.start()
+    samples = {
+        "memory": [], "threads": [], "lag_p99": [], "states": [], "dispatcher": [], "free_slots": [],
+    }
+    started = time.monotonic()
+    try:
+        for _ in range(size["cycles"]):
+            # Ein Zyklus: Verbindungsabbruch und Reload, gemessen nach dem Reload
+            await _flood(hass, panel, entry, size["events"] // 2, True)
+            await _reconnect(hass, panel, entry)
+            await _flood(hass, panel, entry, size["events"] // 2, False)
+            await _reload(hass, panel, entry)
+
+            samples["lag_p99"].append(percentile(probe.take() or [0.0], 99))
+            _forget_outside_integration(hass, request, caplog, panel)
+            gc.collect()
+            samples["memory"].append(_traced_memory())
+            samples["threads"].append(threading.active_count())
+            samples["states"].append(len(hass.states.async_all()))
+            samples["dispatcher"].append(_dispatcher_connections(hass))
+            samples["free_slots"].append(hass.data[DATA_FLEET_SCHEDULER]._semaphore._value)  # pylint: disable=protected-access
+            # gc.collect() und der Snapshot blockieren den Loop, das zählt nicht als Lag
+            await asyncio.sleep(2 * LAG_PROBE_INTERVAL)
+            probe.take()
+    finally:
+        await probe.stop()
+        tracemalloc.stop()
+
+    elapsed = time.monotonic() - started
+    steady = {name: values[WARMUP_CYCLES:] for name, values in samples.items()}
+    report("Soak test", [
+        ("events", size["events"] * size["cycles"]),
+        ("reconnect + reload cycles", size["cycles"]),
+        ("duration", f"{elapsed:.1f} s"),
+        ("traced memory first/last", f"{steady['memory'][0] / 1e6:.2f} / {steady['memory'][-1] / 1e6:.2f} MB"),
+        ("threads first/last", f"{steady['threads'][0]} / {steady['threads'][-1]}"),
+        ("loop lag p99 first/last", f"{steady['lag_p99'][0] * 1000:.1f} / {steady['lag_p99'][-1] * 1000:.1f} ms"),
+        ("entity states first/last", f"{steady['states'][0]} / {steady['states'][-1]}"),
+        ("dispatcher connections first/last", f"{steady['dispatcher'][0]} / {steady['dispatcher'][-1]}"),
+    ])
+
+    # Entities, Callback-Listen und Threads müssen nach jedem Zyklus exakt gleich sein
+    assert len(set(steady["states"])) == 1, steady["states"]
+    assert len(set(steady["dispatcher"])) == 1, steady["dispatcher"]
+    assert max(steady["threads"]) <= steady["threads"][0], steady["threads"]
+    # Höchstens die Verbindung nach dem letzten Reload hält noch einen Slot
+    assert min(steady["free_slots"]) >= ADMISSION_CONCURRENCY - 1, steady["free_slots"]
+    assert_no_upward_trend("traced memory", steady["memory"], MEMORY_GROWTH_BUDGET)
+    assert_no_upward_trend("loop lag p99", steady["lag_p99"], LAG_GROWTH_BUDGET)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,72 @@
+"""Startup benchmark: import time and setup until all entities are registered."""
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.crowipmodule.const import CONF_ZONES
+
+from .common import report
+from .conftest import create_entry, store_known_objects, zone_options
+
+# Sechs Diagnose-Sensoren je Eintrag
+SYSTEM_SENSORS = 6
+
+IMPORT_PROBE = """
+import sys, time
+import homeassistant.helpers.config_validation, homeassistant.components.alarm_control_panel
+started = time.perf_counter()
+import custom_components.crowipmodule
+integration = time.perf_counter() - started
+deferred = "pycrowipmodule" not in sys.modules
+started = time.perf_counter()
+import pycrowipmodule
+library = time.perf_counter() - started
+print(integration, library, deferred)
+"""
+
+
+@pytest.mark.benchmark
+def test_import_time() -> None:
+    """The integration module loads without pulling in pycrowipmodule."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent,
+    ).stdout.split()
+    integration, library, deferred = float(output[0]), float(output[1]), output[2] == "True"
+    report("Import time", [
+        ("custom_components.crowipmodule", f"{integration * 1000:.1f} ms"),
+        ("pycrowipmodule (deferred to setup)", f"{library * 1000:.1f} ms"),
+    ])
+    assert deferred
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("zones", [16, 64, 256])
+async def test_setup_time(hass: HomeAssistant, hass_storage, panel, zones) -> None:
+    """Time from async_setup_entry until all zone entities are registered."""
+    entry = create_entry(hass, panel, {CONF_ZONES: zone_options(zones)})
+    store_known_objects(hass_storage, entry, zones)
+
+    started = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    setup_done = time.perf_counter() - started
+    await hass.async_block_till_done()
+    registered = time.perf_counter() - started
+
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    binary_sensors = [e for e in entities if e.domain == "binary_sensor"]
+    report(f"Setup with {zones} zones", [
+        ("async_setup_entry returned", f"{setup_done * 1000:.1f} ms"),
+        ("all entities registered", f"{registered * 1000:.1f} ms"),
+        ("entities", len(entities)),
+    ])
+    assert len(binary_sensors) == zones + SYSTEM_SENSORS
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
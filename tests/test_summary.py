@@ -0,0 +1,65 @@
+"""Site summary sensors with more than one panel."""
+import pytest
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.crowipmodule.const import DOMAIN, CONF_SUPERVISION, CONF_ZONES
+from custom_components.crowipmodule.summary import SUMMARY_KEYS, async_get_totals
+
+from .conftest import create_entry, zone_options
+from .simulator import CrowPanelSimulator
+
+
+@pytest.fixture
+async def second_panel(socket_enabled):
+    """Another simulated IP Module."""
+    simulator = CrowPanelSimulator()
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+def _unique_ids(hass, entry):
+    return {
+        reg.unique_id
+        for reg in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    }
+
+
+async def test_two_panels(hass: HomeAssistant, panel, second_panel) -> None:
+    """Per-panel sensors exist for both panels; the totals survive unloading their owner."""
+    options = {CONF_ZONES: zone_options(2, **{CONF_SUPERVISION: 60})}
+    first = create_entry(hass, panel, options)
+    second = create_entry(hass, second_panel, options)
+    # Das Setup der Domain lädt beide Einträge
+    assert await hass.config_entries.async_setup(first.entry_id)
+    await hass.async_block_till_done()
+
+    for entry in (first, second):
+        unique_ids = _unique_ids(hass, entry)
+        for key in SUMMARY_KEYS:
+            assert f"crow_summary_{entry.entry_id}_{key}" in unique_ids
+        for num in (1, 2):
+            assert f"crow_supervision_{entry.entry_id}_{num}" in unique_ids
+    # Besitzer ist, wer zuerst fertig war
+    owner = hass.config_entries.async_get_entry(async_get_totals(hass).owner)
+    other = second if owner is first else first
+    assert {f"crow_total_{key}" for key in SUMMARY_KEYS} <= _unique_ids(hass, owner)
+
+    registry = er.async_get(hass)
+    totals = [
+        registry.async_get_entity_id("sensor", DOMAIN, f"crow_total_{key}") for key in SUMMARY_KEYS
+    ]
+    assert await hass.config_entries.async_unload(owner.entry_id)
+    await hass.async_block_till_done()
+
+    # Der andere Eintrag übernimmt die Gesamt-Sensoren unter derselben Entity-ID
+    assert {f"crow_total_{key}" for key in SUMMARY_KEYS} <= _unique_ids(hass, other)
+    for entity_id in totals:
+        state = hass.states.get(entity_id)
+        assert state is not None and state.state != STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(other.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,119 @@
+"""Supervision deadlines on the shared timer."""
+import asyncio
+from datetime import timedelta
+import time
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.crowipmodule.const import DOMAIN, CONF_SUPERVISION, CONF_ZONES
+from custom_components.crowipmodule.supervision import async_get_supervisor
+from custom_components.crowipmodule.timer import async_get_deadline_timer
+from custom_components.crowipmodule.tracker import KIND_ZONE
+
+from .conftest import create_entry, zone_options
+
+KEY = ("entry", 1)
+LONG_WINDOW = 60
+SHORT_WINDOW = 0.05
+# 3 s; im Options-Dialog sind nur ganze Minuten wählbar
+WINDOW_MINUTES = 0.05
+
+
+async def test_rewatch_with_shorter_window(hass: HomeAssistant) -> None:
+    """After a reload with a shorter window, the zone expires at the new window."""
+    supervisor = async_get_supervisor(hass)
+    expired = []
+
+    # Reload: alte Überwachung endet vor der neuen
+    unwatch = supervisor.async_watch(KEY, LONG_WINDOW, lambda: expired.append("old"))
+    unwatch()
+    unwatch = supervisor.async_watch(KEY, SHORT_WINDOW, lambda: expired.append("new"))
+    await asyncio.sleep(4 * SHORT_WINDOW)
+    assert expired == ["new"]
+    unwatch()
+
+    # Reload: das Abmelden der alten Überwachung kommt erst nach der neuen
+    stale_unwatch = supervisor.async_watch(KEY, LONG_WINDOW, lambda: expired.append("old"))
+    unwatch = supervisor.async_watch(KEY, SHORT_WINDOW, lambda: expired.append("newer"))
+    stale_unwatch()
+    await asyncio.sleep(4 * SHORT_WINDOW)
+    assert expired == ["new", "newer"]
+    unwatch()
+
+    # Nichts mehr überwacht: der Loop-Timer ist aus
+    supervisor.async_watch(KEY, LONG_WINDOW, lambda: expired.append("old"))()
+    assert async_get_deadline_timer(hass)._timer is None  # pylint: disable=protected-access
+
+
+async def _wait(hass, predicate, what, timeout=10) -> None:
+    for _ in range(int(timeout / 0.05)):
+        if predicate():
+            return
+        await hass.async_add_executor_job(time.sleep, 0.05)
+    raise AssertionError(f"timed out waiting for {what}")
+
+
+async def test_status_lines_do_not_refresh_window(hass: HomeAssistant, panel) -> None:
+    """A zone that only repeats its state in STATUS replies misses its window."""
+    entry = create_entry(
+        hass, panel, {CONF_ZONES: zone_options(2, **{CONF_SUPERVISION: WINDOW_MINUTES})},
+        keep_alive=1,
+    )
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    data = hass.data[DOMAIN][entry.entry_id]
+    supervision = data.supervision
+    await _wait(hass, lambda: data.connection._connected, "connect")  # pylint: disable=protected-access
+
+    # Zone 2 schaltet, Zone 1 taucht nur in den Keepalive-Antworten auf
+    started = time.monotonic()
+    while time.monotonic() - started < 2 * WINDOW_MINUTES * 60:
+        panel.open_zones ^= {2}
+        panel.push("ZO2" if 2 in panel.open_zones else "ZC2")
+        await panel.drain()
+        await hass.async_add_executor_job(time.sleep, 0.5)
+    await hass.async_block_till_done()
+    assert sum(cmd == "STATUS" for _, cmd in panel.commands) >= 3
+    assert supervision.missed == {1}
+
+    registry = er.async_get(hass)
+    zone_1 = hass.states.get(registry.async_get_entity_id("binary_sensor", DOMAIN, "crow_zone_1"))
+    zone_2 = hass.states.get(registry.async_get_entity_id("binary_sensor", DOMAIN, "crow_zone_2"))
+    assert zone_1.state == STATE_UNAVAILABLE
+    assert zone_2.attributes["last_seen"] is not None
+
+    # Die nächste echte Änderung hebt den Ausfall auf
+    panel.open_zones.add(1)
+    panel.push("ZO1")
+    await panel.drain()
+    await _wait(hass, lambda: not supervision.missed, "recovery")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_last_seen_is_report_time(hass: HomeAssistant, panel, freezer) -> None:
+    """Outages move the retirement clock, not the reported last-seen time."""
+    entry = create_entry(hass, panel, {CONF_ZONES: zone_options(1)})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    data = hass.data[DOMAIN][entry.entry_id]
+    tracker = data.tracker
+    await _wait(hass, lambda: data.connection._connected, "connect")  # pylint: disable=protected-access
+    assert tracker.last_seen(KIND_ZONE, 1) is None
+
+    panel.open_zones.add(1)
+    panel.push("ZO1")
+    await panel.drain()
+    await _wait(hass, lambda: tracker.last_seen(KIND_ZONE, 1) is not None, "report")
+    reported = tracker.last_seen(KIND_ZONE, 1)
+
+    tracker.async_set_connected(False)
+    freezer.tick(timedelta(hours=2))
+    tracker.async_set_connected(True)
+    assert tracker.last_seen(KIND_ZONE, 1) == reported
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
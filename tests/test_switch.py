@@ -0,0 +1,58 @@
+"""Relay pulses and the crowipmodule.pulse service."""
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.crowipmodule.const import DOMAIN, SERVICE_PULSE, CONF_PULSE_LENGTH
+
+from .conftest import create_entry, store_known_objects
+
+
+def _entity_id(hass, unique_id):
+    return er.async_get(hass).async_get_entity_id("switch", DOMAIN, unique_id)
+
+
+@pytest.fixture
+async def entry(hass: HomeAssistant, hass_storage, panel):
+    entry = create_entry(hass, panel, {CONF_PULSE_LENGTH: 60})
+    store_known_objects(hass_storage, entry, 0, outputs=[3])
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_pulse_relay(hass: HomeAssistant, entry) -> None:
+    relay = _entity_id(hass, "crow_relay_1")
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PULSE, {"entity_id": relay, "count": 3}, blocking=True
+    )
+    state = hass.states.get(relay)
+    assert state.state == "on"
+    assert state.attributes["queued_pulses"] == 2
+
+
+async def test_pulse_output_rejected(hass: HomeAssistant, entry) -> None:
+    """Outputs cannot pulse; naming one is a validation error, not AttributeError."""
+    output = _entity_id(hass, "crow_output_3")
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PULSE, {"entity_id": output}, blocking=True
+        )
+
+
+async def test_pulse_device_targets_relays_only(hass: HomeAssistant, entry) -> None:
+    device = dr.async_get(hass).async_get_device({(DOMAIN, "crow_alarm_panel")})
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PULSE, {"device_id": device.id}, blocking=True
+    )
+    assert hass.states.get(_entity_id(hass, "crow_relay_1")).state == "on"
+    assert hass.states.get(_entity_id(hass, "crow_relay_2")).state == "on"
+    assert hass.states.get(_entity_id(hass, "crow_output_3")).state == "off"
+
+
+async def test_service_registered_once(hass: HomeAssistant, entry) -> None:
+    assert hass.services.has_service(DOMAIN, SERVICE_PULSE)
@@ -0,0 +1,50 @@
+"""Indexed in-memory timeline."""
+from unittest.mock import patch
+
+from custom_components.crowipmodule.const import SIGNAL_ZONE_UPDATE, SIGNAL_AREA_UPDATE
+from custom_components.crowipmodule.timeline import CrowTimeline
+
+MAX_EVENTS = 100
+
+
+class _Panel:
+    """State dicts in the layout of pycrowipmodule.CrowIPAlarmPanel."""
+
+    def __init__(self) -> None:
+        self.zone_state = {n: {"status": {"open": False}} for n in (1, 2)}
+        self.area_state = {n: {"status": {"armed": False}} for n in (1, 2)}
+        self.output_state = {}
+        self.system_state = {"status": {}}
+
+
+def test_kind_query_uses_kind_index() -> None:
+    """A kind without number bisects its own index and survives trimming."""
+    panel = _Panel()
+    timeline = CrowTimeline(panel, max_events=MAX_EVENTS)
+    clock = iter(range(10000))
+    with patch("custom_components.crowipmodule.timeline.time.time", lambda: next(clock)):
+        for _ in range(MAX_EVENTS):
+            for num in (1, 2):
+                status = panel.zone_state[num]["status"]
+                status["open"] = not status["open"]
+                timeline.record(SIGNAL_ZONE_UPDATE, str(num))
+            status = panel.area_state[1]["status"]
+            status["armed"] = not status["armed"]
+            timeline.record(SIGNAL_AREA_UPDATE, "A")
+
+    everything = timeline.query()
+    assert len(everything) <= MAX_EVENTS * 1.1
+    first = everything[0]["time"]
+    zones = timeline.query(start=first + 30, end=first + 59, kind="zone")
+    assert zones == [
+        event for event in everything
+        if event["kind"] == "zone" and first + 30 <= event["time"] <= first + 59
+    ]
+    assert len(zones) == 20
+    assert timeline.query(kind="zone", start=0, end=first - 1) == []
+    assert timeline.query(kind="output") == []
+
+    # Die Filter arbeiten auf dem Index der Art, nicht auf dem globalen
+    timeline._all.events.clear()  # pylint: disable=protected-access
+    timeline._all.times.clear()  # pylint: disable=protected-access
+    assert timeline.query(start=first + 30, end=first + 59, kind="zone") == zones
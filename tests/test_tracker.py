@@ -0,0 +1,135 @@
+"""Retirement of zones the panel no longer reports."""
+from datetime import timedelta
+import time
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+
+from custom_components.crowipmodule.const import (
+    DOMAIN, CONF_RETIRE_AFTER, CONF_ZONES, CONF_OUTPUTS,
+)
+
+from .conftest import create_entry, store_known_objects, zone_options
+from .simulator import CrowPanelSimulator
+
+# Meldet der Simulator nie (er kennt nur 1..16)
+SILENT_ZONE = 20
+
+
+async def _wait_connected(hass, entry) -> None:
+    connection = hass.data[DOMAIN][entry.entry_id].connection
+    for _ in range(200):
+        if connection._connected:  # pylint: disable=protected-access
+            return
+        await hass.async_add_executor_job(time.sleep, 0.01)
+    raise AssertionError("panel did not connect")
+
+
+def _zone_entity(hass, num):
+    return er.async_get(hass).async_get_entity_id("binary_sensor", DOMAIN, f"crow_zone_{num}")
+
+
+async def test_outage_does_not_retire(hass: HomeAssistant, hass_storage, panel, freezer) -> None:
+    """Time without a connection, also while HA was down, does not count."""
+    entry = create_entry(hass, panel, {CONF_RETIRE_AFTER: 1})
+    store_known_objects(hass_storage, entry, SILENT_ZONE)
+    # Zuletzt vor 2 h gesehen, HA war so lange aus
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.objects"]["data"]["zone"]
+    for num in stored:
+        stored[num] -= 7200
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert _zone_entity(hass, SILENT_ZONE) is not None
+
+    await _wait_connected(hass, entry)
+    freezer.tick(timedelta(minutes=50))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert _zone_entity(hass, SILENT_ZONE) is not None
+
+    # Verbunden, aber die Zone meldet sich eine Stunde lang nicht; Zone 1 öffnet
+    freezer.tick(timedelta(minutes=20))
+    panel.push("ZO1")
+    await panel.drain()
+    await hass.async_add_executor_job(time.sleep, 0.1)
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert _zone_entity(hass, SILENT_ZONE) is None
+    assert _zone_entity(hass, 1) is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def _unique_ids(hass, entry, domain):
+    return {
+        reg.unique_id
+        for reg in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if reg.domain == domain
+    }
+
+
+async def test_configured_objects_and_transitions(hass: HomeAssistant, panel) -> None:
+    """Configured objects always get entities; others only after a real change."""
+    entry = create_entry(hass, panel, {
+        CONF_ZONES: zone_options(2), CONF_OUTPUTS: {"3": {"name": "Modem"}},
+    })
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    # Status-Scan beim Verbinden und einige Keepalives: alle 16 Zonen melden sich
+    await _wait_connected(hass, entry)
+    for _ in range(3):
+        panel.push(*panel.status_lines())
+        await panel.drain()
+    await hass.async_add_executor_job(time.sleep, 0.1)
+    await hass.async_block_till_done()
+
+    zones = {f"crow_zone_{num}" for num in (1, 2)}
+    assert {uid for uid in _unique_ids(hass, entry, "binary_sensor") if uid.startswith("crow_zone_")} == zones
+    assert "crow_output_3" in _unique_ids(hass, entry, "switch")
+
+    # Zone 5 öffnet: erst jetzt gibt es sie wirklich
+    panel.open_zones.add(5)
+    panel.push("ZO5")
+    await panel.drain()
+    await hass.async_add_executor_job(time.sleep, 0.1)
+    await hass.async_block_till_done()
+    assert "crow_zone_5" in _unique_ids(hass, entry, "binary_sensor")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_retirement_keeps_other_entries(hass: HomeAssistant, hass_storage, panel, socket_enabled, freezer) -> None:
+    """Retiring a zone of one panel leaves the same zone of another panel alone."""
+    other_panel = CrowPanelSimulator()
+    await other_panel.start()
+    try:
+        retiring = create_entry(hass, panel, {CONF_RETIRE_AFTER: 1})
+        store_known_objects(hass_storage, retiring, SILENT_ZONE)
+        assert await hass.config_entries.async_setup(retiring.entry_id)
+        await hass.async_block_till_done()
+        await _wait_connected(hass, retiring)
+
+        # Gleiche Unique-ID, aber im Registry einem anderen Eintrag zugeordnet
+        other = create_entry(hass, other_panel)
+        registry = er.async_get(hass)
+        registry.async_remove(_zone_entity(hass, SILENT_ZONE))
+        registry.async_get_or_create(
+            "binary_sensor", DOMAIN, f"crow_zone_{SILENT_ZONE}", config_entry=other
+        )
+
+        freezer.tick(timedelta(minutes=70))
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert _zone_entity(hass, SILENT_ZONE) is not None
+        assert _zone_entity(hass, 1) is None
+
+        assert await hass.config_entries.async_unload(retiring.entry_id)
+        await hass.async_block_till_done()
+    finally:
+        await other_panel.stop()
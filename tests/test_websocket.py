@@ -0,0 +1,40 @@
+"""Websocket timeline query."""
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.crowipmodule.const import DOMAIN
+
+from .conftest import create_entry
+
+
+async def _query(client, entry, **fields):
+    await client.send_json_auto_id({"type": f"{DOMAIN}/timeline", "entry_id": entry.entry_id, **fields})
+    return await client.receive_json()
+
+
+async def test_number_needs_kind(hass: HomeAssistant, hass_ws_client, panel) -> None:
+    """A number without kind, or with kind system, is rejected instead of ignored."""
+    entry = create_entry(hass, panel)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    client = await hass_ws_client(hass)
+
+    for fields in ({"number": 3}, {"kind": "system", "number": 3}):
+        msg = await _query(client, entry, **fields)
+        assert not msg["success"]
+        assert msg["error"]["code"] == "invalid_format"
+
+    panel.push("ZO3")
+    await panel.drain()
+    timeline = hass.data[DOMAIN][entry.entry_id].timeline
+    for _ in range(200):
+        if timeline.query(kind="zone", number=3):
+            break
+        await hass.async_add_executor_job(time.sleep, 0.01)
+    msg = await _query(client, entry, kind="zone", number=3)
+    assert msg["success"]
+    assert [event["number"] for event in msg["result"]["events"]] == [3]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()